@@ -3,15 +3,24 @@
 # Copyright © 2023 Team Rizzo
 
 import asyncio
-import time
+import json
+import hashlib
+import logging
+import random
+import signal
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 import numpy as np
 import bittensor as bt
 from talisman_ai.base.validator import BaseValidatorNeuron
 from talisman_ai.validator.forward import forward
-from talisman_ai.validator.validation_client import ValidationClient
+from talisman_ai.validator.validation_client import ValidationClient, ValidationResultRecord, create_http_client
 from talisman_ai.validator.grader import grade_hotkey, CONSENSUS_VALID, CONSENSUS_INVALID
-from talisman_ai.analyzer import setup_analyzer
+from talisman_ai.analyzer import get_analyzer
+from talisman_ai import config
+from talisman_ai.utils.logging import is_enabled_for
 import talisman_ai.protocol
 
 
@@ -32,19 +41,97 @@ class Validator(BaseValidatorNeuron):
         bt.logging.info("load_state()")
         self.load_state()
 
+        # The validator hotkey never changes at runtime; resolve its address once
+        self._validator_ss58 = str(self.wallet.hotkey.ss58_address)
+
         # Initialize analyzer once (reused for all validations)
         bt.logging.info("[VALIDATION] Initializing analyzer...")
-        self._analyzer = setup_analyzer()
+        self._analyzer = get_analyzer()
         bt.logging.info("[VALIDATION] Analyzer initialized")
 
-        # Initialize validation client
-        self._validation_client = ValidationClient(wallet=self.wallet)
+        # Initialize validation client with a shared keep-alive connection pool
+        self._http_client = create_http_client(config.BATCH_HTTP_TIMEOUT)
+        self._validation_client = ValidationClient(wallet=self.wallet, http_client=self._http_client)
         self._validation_task: Optional[asyncio.Task] = None
-        self._pending_results: List[Dict[str, Any]] = []
+        # Bounded buffer: under a prolonged API outage the oldest results are dropped
+        self._max_pending = config.VALIDATION_MAX_PENDING_RESULTS
+        self._pending_results: deque = deque(maxlen=self._max_pending)
+        # ValidationResult synapses (hotkey -> results) held back until their batch is submitted
+        self._pending_synapses: Dict[str, List[Dict[str, Any]]] = {}
+        self._submit_retries = config.VALIDATION_SUBMIT_RETRIES
+        self._submit_backoff_base = 1.0
+        self._submit_backoff_cap = 30.0
+        # Consecutive failed flushes; full tracebacks are only logged for the first few
+        self._submit_fail_count = 0
+        self._submit_fail_traceback_limit = 3
+
+        # Result batching: flush when the buffer is full or on a periodic timer
+        self._batch_size = config.VALIDATION_RESULT_BATCH_SIZE
+        self._flush_interval = config.VALIDATION_FLUSH_INTERVAL
+        self._flush_task: Optional[asyncio.Task] = None
+        self._submit_lock = asyncio.Lock()
+
+        # Bound the number of gradings in flight so the LLM backend isn't overwhelmed
+        self._grade_sem = asyncio.Semaphore(config.VALIDATION_MAX_CONCURRENCY)
+        # Dedicated grading pool (grading is mostly blocking LLM I/O, so threads suffice)
+        self._grader_pool = ThreadPoolExecutor(
+            max_workers=config.VALIDATION_MAX_CONCURRENCY, thread_name_prefix="grader"
+        )
+
+        # LRU of passing grades keyed by a hash of the full post payload, so
+        # re-delivered or replayed validations are not re-graded
+        self._grade_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._grade_cache_max = 4096
+        self._grade_cache_lock = threading.Lock()  # grading runs on pool threads
+
+        # Checkpoint state only after scores change, at most once every `_save_every` forwards
+        self._forwards_since_save = 0
+        self._save_every = 50
+        self._state_dirty = False
+
+        # Hotkey -> uid lookup table, refreshed on every metagraph resync
+        self._rebuild_hotkey_index()
+
+    def _rebuild_hotkey_index(self):
+        """Rebuild the hotkey -> uid lookup table from the current metagraph."""
+        self._hotkey_to_uid: Dict[str, int] = {
+            hotkey: uid for uid, hotkey in enumerate(self.metagraph.hotkeys)
+        }
+
+    def resync_metagraph(self):
+        """Resync the metagraph and refresh the hotkey -> uid lookup table."""
+        super().resync_metagraph()
+        self._rebuild_hotkey_index()
+
+    @staticmethod
+    def _grade_cache_key(post: Dict[str, Any]) -> str:
+        """Stable hash of the full post payload (content, tokens, sentiment, ...)."""
+        canonical = json.dumps(post, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _grade_post(self, post: Dict[str, Any]):
+        """Grade a single post, reusing a cached pass for identical payloads."""
+        key = self._grade_cache_key(post)
+        with self._grade_cache_lock:
+            cached = self._grade_cache.get(key)
+            if cached is not None:
+                self._grade_cache.move_to_end(key)
+                return cached
+
+        label, grade_result = grade_hotkey([post], analyzer=self._analyzer)
+
+        # Only passes are cached: a transient LLM failure degrades to dimension defaults
+        # and surfaces as an ordinary mismatch, so failures must always be re-graded
+        if label == CONSENSUS_VALID:
+            with self._grade_cache_lock:
+                self._grade_cache[key] = (label, grade_result)
+                while len(self._grade_cache) > self._grade_cache_max:
+                    self._grade_cache.popitem(last=False)
+        return label, grade_result
 
     async def _on_validations(self, validations: List[Dict[str, Any]]):
         """
-        Process multiple validation payloads in batch (sequentially).
+        Process multiple validation payloads in batch (concurrently, bounded by `_grade_sem`).
         
         Args:
             validations: List of validation payloads, each with validation_id, miner_hotkey, post, selected_at
@@ -54,34 +141,28 @@ class Validator(BaseValidatorNeuron):
         
         bt.logging.info(f"[VALIDATION] Processing {len(validations)} validation(s) in batch")
         
-        # Process all validations sequentially (one at a time)
-        results = []
+        # Grade all validations concurrently; gather preserves input order
         validation_results_by_hotkey = {}  # Group validation results by hotkey for batching
-        
-        for validation in validations:
-            result = await self._process_single_validation(validation, validation_results_by_hotkey)
-            results.append(result)
-        
-        # Add all results to pending
+        results = await asyncio.gather(*[
+            self._process_single_validation(validation, validation_results_by_hotkey)
+            for validation in validations
+        ])
+        
+        # Add all results (and their miner synapses) to pending; submit immediately only
+        # once a full batch has accumulated, otherwise leave them for the periodic flush
+        # task (and the final flush on shutdown). Synapses go out with their batch once
+        # its API submission has been attempted, as in the unbatched flow.
         self._pending_results.extend(results)
-        
-        # Submit all results to API FIRST (before sending synapses)
-        await self._submit_pending_results()
-        
-        # Send batched ValidationResult synapses to miners AFTER API submission
-        if validation_results_by_hotkey:
-            bt.logging.info(
-                f"[VALIDATION] Sending ValidationResult synapses to {len(validation_results_by_hotkey)} miner(s)"
-            )
-            await self._send_batched_validation_results(validation_results_by_hotkey)
-        else:
-            bt.logging.warning("[VALIDATION] No validation results to send to miners")
+        for miner_hotkey, hotkey_results in validation_results_by_hotkey.items():
+            self._pending_synapses.setdefault(miner_hotkey, []).extend(hotkey_results)
+        if len(self._pending_results) >= self._batch_size:
+            await self._submit_pending_results()
     
     async def _process_single_validation(
         self, 
         validation: Dict[str, Any],
         validation_results_by_hotkey: Dict[str, List[Dict[str, Any]]]
-    ) -> Dict[str, Any]:
+    ) -> ValidationResultRecord:
         """
         Process a single validation payload.
         
@@ -90,21 +171,20 @@ class Validator(BaseValidatorNeuron):
             validation_results_by_hotkey: Dictionary to accumulate validation results by hotkey for batching
         
         Returns:
-            Result dict ready for submission
+            Result record ready for submission
         """
         validation_id = validation.get("validation_id")
         miner_hotkey = validation.get("miner_hotkey")
         post = validation.get("post", {})
         
-        bt.logging.info(f"[VALIDATION] Processing validation_id={validation_id}, miner_hotkey={miner_hotkey}")
+        info_enabled = is_enabled_for(logging.INFO)
+        if info_enabled:
+            bt.logging.info(f"[VALIDATION] Processing validation_id={validation_id}, miner_hotkey={miner_hotkey}")
         
         # Grade the post (run in executor to avoid blocking, reuse analyzer)
-        loop = asyncio.get_event_loop()
-        # Use lambda to pass analyzer as second positional argument
-        label, grade_result = await loop.run_in_executor(
-            None, 
-            lambda: grade_hotkey([post], analyzer=self._analyzer)
-        )
+        async with self._grade_sem:
+            loop = asyncio.get_running_loop()
+            label, grade_result = await loop.run_in_executor(self._grader_pool, self._grade_post, post)
         
         # Determine success and failure_reason
         success = label == CONSENSUS_VALID
@@ -112,18 +192,19 @@ class Validator(BaseValidatorNeuron):
         post_id = post.get("post_id", "unknown")
         
         if not success:
-            error_info = grade_result.get("error", {})
+            eget = grade_result.get("error", {}).get
             failure_reason = {
-                "code": error_info.get("code", "unknown_error"),
-                "message": error_info.get("message", "Unknown error"),
-                "post_id": error_info.get("post_id", post_id),
-                "details": error_info.get("details", {})
+                "code": eget("code", "unknown_error"),
+                "message": eget("message", "Unknown error"),
+                # `or` also covers keys present with a None value (e.g. _err(..., post_id=None))
+                "post_id": eget("post_id") or post_id,
+                "details": eget("details") or {}
             }
             bt.logging.warning(
                 f"[VALIDATION] ✗ Validation FAILED for {miner_hotkey}: "
                 f"{failure_reason['code']} - {failure_reason['message']}"
             )
-        else:
+        elif info_enabled:
             bt.logging.info(f"[VALIDATION] ✓ Validation PASSED for {miner_hotkey}")
         
         # Accumulate validation result for batching (instead of sending immediately)
@@ -137,32 +218,87 @@ class Validator(BaseValidatorNeuron):
             "failure_reason": failure_reason
         })
         
-        # Return result dict
-        return {
-            "validator_hotkey": str(self.wallet.hotkey.ss58_address),
-            "validation_id": validation_id,
-            "miner_hotkey": miner_hotkey,
-            "success": success,
-            "failure_reason": failure_reason,
-        }
+        # Return result record (serialized to JSON only at submission time)
+        return ValidationResultRecord(
+            validator_hotkey=self._validator_ss58,
+            validation_id=validation_id,
+            miner_hotkey=miner_hotkey,
+            success=success,
+            failure_reason=failure_reason,
+        )
 
     async def _submit_pending_results(self):
-        """Submit pending validation results to the API"""
-        if not self._pending_results:
-            return
-        
-        results = self._pending_results.copy()
-        self._pending_results.clear()
+        """
+        Submit pending validation results to the API, then send the batch's
+        ValidationResult synapses to miners.
+
+        `_submit_lock` is held only while swapping the buffers out and while putting
+        failed results back, so producers never wait behind a slow submission and a
+        failed batch can't interleave with (or duplicate) freshly appended results.
+        """
+        async with self._submit_lock:
+            if not self._pending_results:
+                return
+            # Swap in fresh buffers instead of copying and clearing the old ones
+            results = self._pending_results
+            self._pending_results = deque(maxlen=self._max_pending)
+            validation_results_by_hotkey = self._pending_synapses
+            self._pending_synapses = {}
         
         bt.logging.info(f"[VALIDATION] Submitting {len(results)} validation result(s)")
         
-        try:
-            response = await self._validation_client.submit_results(results)
-            bt.logging.info(f"[VALIDATION] ✓ Submitted results: {response}")
-        except Exception as e:
-            bt.logging.error(f"[VALIDATION] ✗ Failed to submit results: {e}", exc_info=True)
-            # Re-add results to pending for retry
-            self._pending_results.extend(results)
+        submitted = False
+        for attempt in range(self._submit_retries):
+            try:
+                response = await self._validation_client.submit_results(list(results))
+                bt.logging.info(f"[VALIDATION] ✓ Submitted results: {response}")
+                self._submit_fail_count = 0
+                submitted = True
+                break
+            except Exception as e:
+                if attempt < self._submit_retries - 1:
+                    # Full jitter: validators recovering from the same API outage spread out
+                    delay = random.uniform(0, min(self._submit_backoff_base * (2 ** attempt), self._submit_backoff_cap))
+                    bt.logging.warning(
+                        f"[VALIDATION] Submit attempt {attempt + 1}/{self._submit_retries} failed: {e}, "
+                        f"retrying in {delay:.1f}s"
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    self._submit_fail_count += 1
+                    if self._submit_fail_count <= self._submit_fail_traceback_limit:
+                        bt.logging.error(f"[VALIDATION] ✗ Failed to submit results: {e}", exc_info=True)
+                    else:
+                        bt.logging.warning(
+                            f"[VALIDATION] ✗ Failed to submit results ({self._submit_fail_count} consecutive): {e!r}"
+                        )
+        
+        if not submitted:
+            # Re-queue ahead of anything that arrived meanwhile; the bounded deque keeps
+            # the newest entries, dropping the oldest ones once capacity is exceeded
+            async with self._submit_lock:
+                total = len(results) + len(self._pending_results)
+                results.extend(self._pending_results)
+                self._pending_results = results
+            dropped = total - len(results)
+            if dropped > 0:
+                bt.logging.warning(f"[VALIDATION] Pending results buffer full, dropped {dropped} oldest result(s)")
+        
+        # Send batched ValidationResult synapses to miners AFTER the API submission attempt
+        if validation_results_by_hotkey:
+            bt.logging.info(
+                f"[VALIDATION] Sending ValidationResult synapses to {len(validation_results_by_hotkey)} miner(s)"
+            )
+            await self._send_batched_validation_results(validation_results_by_hotkey)
+
+    async def _periodic_flush(self):
+        """Flush pending validation results every `_flush_interval` seconds."""
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self._submit_pending_results()
+            except Exception as e:
+                bt.logging.error(f"[VALIDATION] Periodic flush failed: {e}")
 
     async def _on_scores(self, scores_data: Dict[str, Any]):
         """
@@ -189,22 +325,18 @@ class Validator(BaseValidatorNeuron):
             bt.logging.warning("[SCORES] No scores in response")
             return
         
-        uids_to_update = []
-        rewards_array = []
-        
-        for hotkey, score in scores.items():
-            try:
-                uid = self.metagraph.hotkeys.index(hotkey)
-                uids_to_update.append(uid)
-                rewards_array.append(float(score))
-            except ValueError:
-                bt.logging.debug(f"[SCORES] Hotkey {hotkey} not found in metagraph, skipping")
-        
-        if uids_to_update and rewards_array:
-            rewards_np = np.array(rewards_array)
-            uids_np = np.array(uids_to_update)
-            bt.logging.info(f"[SCORES] Setting rewards for {len(uids_to_update)} miner(s)...")
-            self.update_scores(rewards_np, uids_np.tolist())
+        hotkey_to_uid = self._hotkey_to_uid
+        pairs = [(hotkey_to_uid[hk], score) for hk, score in scores.items() if hk in hotkey_to_uid]
+        count = len(pairs)
+        if count < len(scores):
+            bt.logging.debug(f"[SCORES] {len(scores) - count} hotkey(s) not found in metagraph, skipping")
+        
+        if count:
+            uids_np = np.fromiter((uid for uid, _ in pairs), dtype=np.int64, count=count)
+            rewards_np = np.fromiter((float(score) for _, score in pairs), dtype=np.float32, count=count)
+            bt.logging.info(f"[SCORES] Setting rewards for {count} miner(s)...")
+            self.update_scores(rewards_np, uids_np)
+            self._state_dirty = True
             bt.logging.info(
                 f"[SCORES] ✓ Set rewards: range {rewards_np.min():.3f} - {rewards_np.max():.3f}, "
                 f"mean={rewards_np.mean():.3f}"
@@ -236,27 +368,28 @@ class Validator(BaseValidatorNeuron):
             f"[SCORES] Sending Score synapses to {len(scores)} miner(s) for block window {block_window_start}-{block_window_end}"
         )
         
-        # Get axons for all miners with scores
+        # Get axons for all miners with scores (bind lookups to locals for the loop)
         axons_to_query = []
         score_synapses = []
+        hotkey_to_uid = self._hotkey_to_uid
+        axons = self.metagraph.axons
+        validator_ss58 = self._validator_ss58
+        Score = talisman_ai.protocol.Score
         
         for hotkey, score in scores.items():
-            try:
-                uid = self.metagraph.hotkeys.index(hotkey)
-                axon = self.metagraph.axons[uid]
-                axons_to_query.append(axon)
-                
-                # Create Score synapse for this miner
-                synapse = talisman_ai.protocol.Score(
-                    block_window_start=block_window_start,
-                    block_window_end=block_window_end,
-                    score=float(score),
-                    validator_hotkey=str(self.wallet.hotkey.ss58_address)
-                )
-                score_synapses.append(synapse)
-            except ValueError:
+            uid = hotkey_to_uid.get(hotkey)
+            if uid is None:
                 bt.logging.debug(f"[SCORES] Hotkey {hotkey} not found in metagraph, skipping Score synapse")
                 continue
+            axons_to_query.append(axons[uid])
+            
+            # Create Score synapse for this miner
+            score_synapses.append(Score(
+                block_window_start=block_window_start,
+                block_window_end=block_window_end,
+                score=float(score),
+                validator_hotkey=validator_ss58
+            ))
         
         if not axons_to_query:
             bt.logging.warning("[SCORES] No valid axons found to send Score synapses")
@@ -298,12 +431,17 @@ class Validator(BaseValidatorNeuron):
         if not validation_results_by_hotkey:
             return
         
+        hotkey_to_uid = self._hotkey_to_uid
+        axons = self.metagraph.axons
+        
         # Send validation results to each hotkey
         for miner_hotkey, results in validation_results_by_hotkey.items():
             try:
                 # Find the miner's axon in the metagraph
-                uid = self.metagraph.hotkeys.index(miner_hotkey)
-                axon = self.metagraph.axons[uid]
+                uid = hotkey_to_uid.get(miner_hotkey)
+                if uid is None:
+                    raise ValueError(miner_hotkey)
+                axon = axons[uid]
                 
                 # Create ValidationResult synapses for all posts validated for this hotkey
                 synapses = []
@@ -312,7 +450,7 @@ class Validator(BaseValidatorNeuron):
                         validation_id=result["validation_id"],
                         post_id=result["post_id"],
                         success=result["success"],
-                        validator_hotkey=str(self.wallet.hotkey.ss58_address),
+                        validator_hotkey=self._validator_ss58,
                         failure_reason=result["failure_reason"]
                     )
                     synapses.append(synapse)
@@ -366,13 +504,64 @@ class Validator(BaseValidatorNeuron):
             )
             bt.logging.info("[VALIDATION] Started validation client")
 
-        self.save_state()
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._periodic_flush())
+
+        self._forwards_since_save += 1
+        if self._state_dirty and self._forwards_since_save >= self._save_every:
+            self.save_state()
+            self._forwards_since_save = 0
+            self._state_dirty = False
         return await forward(self)
 
+    async def _shutdown(self):
+        """
+        Stop the background tasks, submit any buffered results, then release pooled
+        HTTP connections. Results that still can't be submitted are logged, not dropped silently.
+        """
+        for task in (self._validation_task, self._flush_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+                except Exception as e:
+                    bt.logging.debug(f"[VALIDATION] Background task ended with error: {e}")
+        await self._submit_pending_results()
+        if self._pending_results:
+            bt.logging.warning(
+                f"[VALIDATION] {len(self._pending_results)} validation result(s) could not be submitted before shutdown"
+            )
+        await self._http_client.aclose()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super().__exit__(exc_type, exc_value, traceback)
+        self._grader_pool.shutdown(wait=False)
+        # Flush buffered results and close the HTTP pool on the validator's own loop
+        try:
+            if self.loop.is_running():
+                # Background thread didn't stop in time; run the shutdown on its loop
+                asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop).result(timeout=30)
+            else:
+                self.loop.run_until_complete(self._shutdown())
+        except Exception as e:
+            bt.logging.error(f"[VALIDATION] Shutdown flush failed: {e}")
+        # forward() checkpoints only every `_save_every` forwards; don't lose the rest
+        if self._state_dirty:
+            self.save_state()
+            self._state_dirty = False
+
 
 # Entrypoint
 if __name__ == "__main__":
+    # Block the main thread until SIGINT/SIGTERM instead of polling; the validator
+    # itself runs in a background thread
+    stop_event = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop_event.set())
+
     with Validator() as validator:
-        while True:
-            bt.logging.info(f"Validator running... {time.time()}")
-            time.sleep(5)
+        bt.logging.info("Validator running...")
+        stop_event.wait()
+        bt.logging.info("Shutdown signal received, stopping validator")
@@ -3,8 +3,9 @@ Analyzer module for subnet relevance and sentiment analysis.
 """
 
 import json
+import threading
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 from talisman_ai import config  # Loads .miner_env and .vali_env
 from .relevance import SubnetRelevanceAnalyzer
 
@@ -53,3 +54,26 @@ def setup_analyzer(subnets_file: str = None) -> SubnetRelevanceAnalyzer:
     
     return analyzer
 
+_shared_analyzers: Dict[str, SubnetRelevanceAnalyzer] = {}
+_shared_lock = threading.Lock()
+
+def get_analyzer(subnets_file: str = None) -> SubnetRelevanceAnalyzer:
+    """
+    Process-wide shared analyzer, built with setup_analyzer() on first use.
+    
+    Miner and validator components in the same process get the same instance (one
+    subnet index, HTTP pool and decision cache) instead of each building their own.
+    Use setup_analyzer() directly for a private instance.
+    
+    Args:
+        subnets_file: Path to subnets.json file. If None, uses default location.
+        
+    Returns:
+        Shared SubnetRelevanceAnalyzer instance for that subnets file
+    """
+    key = str(Path(subnets_file).resolve()) if subnets_file is not None else ""
+    with _shared_lock:
+        analyzer = _shared_analyzers.get(key)
+        if analyzer is None:
+            analyzer = _shared_analyzers[key] = setup_analyzer(subnets_file)
+        return analyzer
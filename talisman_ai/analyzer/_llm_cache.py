@@ -0,0 +1,62 @@
+"""
+Exact-match response cache for LLM decisions.
+
+Entries are keyed by a SHA256 over (model, messages, tool), so any prompt or model
+change naturally misses instead of serving a stale answer. Bounded LRU with TTL,
+safe to share between the analyzer's worker threads.
+"""
+
+from collections import OrderedDict
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+def make_key(model: str, messages: List[Dict[str, str]], tool: str) -> str:
+    """Deterministic cache key for one temperature-0 tool-call request"""
+    payload = json.dumps({"m": model, "msgs": messages, "tool": tool, "t": 0}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Thread-safe TTL + LRU cache of parsed LLM decisions"""
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 3600):
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value, or None on a miss / expired entry"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                if time.monotonic() < entry[0]:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Any):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._data),
+                "hit_rate": self.hits / total if total else 0.0,
+            }
@@ -7,7 +7,20 @@ deterministic validation via exact matching of canonical strings.
 
 from enum import Enum
 
-class ContentType(str, Enum):
+
+class _ValueEnum(str, Enum):
+    """str-valued Enum base with a fast value lookup"""
+
+    @classmethod
+    def from_value(cls, value):
+        """Equivalent to cls(value), but resolves via the value map directly"""
+        try:
+            return cls._value2member_map_[value]
+        except (KeyError, TypeError):
+            return cls(value)  # raises the usual ValueError for unknown values
+
+
+class ContentType(_ValueEnum):
     """Type of X-Post content"""
     TECHNICAL_INSIGHT = "technical_insight"      # Technical analysis, architecture, code
     ANNOUNCEMENT = "announcement"                # Product launches, releases
@@ -26,7 +39,7 @@ class ContentType(str, Enum):
     OTHER = "other"
 
 
-class MarketAnalysis(str, Enum):
+class MarketAnalysis(_ValueEnum):
     """Market analysis type"""
     TECHNICAL = "technical"     # Indicators, order flow, patterns
     ECONOMIC = "economic"       # Fundamentals, costs, revenue
@@ -35,7 +48,7 @@ class MarketAnalysis(str, Enum):
     OTHER = "other"
 
 
-class ImpactPotential(str, Enum):
+class ImpactPotential(_ValueEnum):
     """Expected community impact"""
     HIGH = "HIGH"       # Major release/mainnet/security incident
     MEDIUM = "MEDIUM"   # Notable update/launch/partnership
@@ -43,7 +56,7 @@ class ImpactPotential(str, Enum):
     NONE = "NONE"      # Chatty/irrelevant
 
 
-class Sentiment(str, Enum):
+class Sentiment(_ValueEnum):
     """Market sentiment tone"""
     VERY_BULLISH = "very_bullish"   # 🚀, moon, ATH, pump
     BULLISH = "bullish"             # Positive price/growth signals
@@ -52,7 +65,7 @@ class Sentiment(str, Enum):
     VERY_BEARISH = "very_bearish"   # Crash, exploit, major failure
 
 
-class TechnicalQuality(str, Enum):
+class TechnicalQuality(_ValueEnum):
     """Quality of technical information"""
     HIGH = "high"       # ≥2 specifics: APIs, versions, repos, endpoints, metrics
     MEDIUM = "medium"   # 1 specific detail
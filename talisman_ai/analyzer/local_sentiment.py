@@ -0,0 +1,51 @@
+"""
+Local sentiment classifier (optional replacement for the sentiment LLM call).
+
+Runs a small Hugging Face sequence-classification model on CPU and maps its
+negative/neutral/positive output onto the five Sentiment labels. Requires the
+optional `transformers` dependency; enable with SENTIMENT_BACKEND=local and pick
+the model with SENTIMENT_MODEL (config.py holds the default).
+"""
+
+import threading
+from typing import List
+
+import bittensor as bt
+
+from .classifications import Sentiment
+
+# Model confidence at/above which positive/negative become very_bullish/very_bearish
+STRONG_SENTIMENT_THRESHOLD = 0.9
+
+
+def _to_label(label: str, score: float) -> str:
+    label = label.lower()
+    if label.startswith("pos"):
+        return (Sentiment.VERY_BULLISH if score >= STRONG_SENTIMENT_THRESHOLD else Sentiment.BULLISH).value
+    if label.startswith("neg"):
+        return (Sentiment.VERY_BEARISH if score >= STRONG_SENTIMENT_THRESHOLD else Sentiment.BEARISH).value
+    return Sentiment.NEUTRAL.value
+
+
+class LocalSentimentClassifier:
+    """Batched, thread-safe wrapper around a transformers text-classification pipeline"""
+
+    def __init__(self, model: str, batch_size: int = 32):
+        # Imported here so the default LLM backend never pays for loading transformers
+        try:
+            from transformers import pipeline
+        except ImportError as e:
+            raise ImportError("transformers is required for SENTIMENT_BACKEND=local") from e
+        self._pipe = pipeline("text-classification", model=model, tokenizer=model, device=-1)
+        self._batch_size = batch_size
+        # HF pipelines are not safe to call from several threads at once
+        self._lock = threading.Lock()
+        bt.logging.info(f"[ANALYZER] Local sentiment model loaded: {model}")
+
+    def classify_many(self, texts: List[str]) -> List[str]:
+        """Sentiment label value per text, in order"""
+        if not texts:
+            return []
+        with self._lock:
+            outputs = self._pipe(list(texts), batch_size=self._batch_size, truncation=True, max_length=128)
+        return [_to_label(out["label"], out["score"]) for out in outputs]
@@ -12,16 +12,33 @@ Key Features:
 - Evidence extraction (exact spans + anchors for auditability)
 """
 
-from openai import OpenAI
+from openai import OpenAI, APIError, RateLimitError, APITimeoutError, APIConnectionError
+from concurrent.futures import Future, ThreadPoolExecutor
+import httpx
 import json
+import random
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import time
 from datetime import datetime
 import bittensor as bt
+import logging
 from difflib import SequenceMatcher
 
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except ImportError:
+    _rf_process = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ._llm_cache import LLMResponseCache, make_key
+from .local_sentiment import LocalSentimentClassifier
+from talisman_ai.utils.logging import is_enabled_for
 from .classifications import ContentType, Sentiment, TechnicalQuality, MarketAnalysis, ImpactPotential
 
 # Import centralized config
@@ -31,9 +48,15 @@ except ImportError:
     config = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class PostClassification:
     """Canonical classification result"""
+    __slots__ = (
+        "subnet_id", "subnet_name", "content_type", "sentiment", "technical_quality",
+        "market_analysis", "impact_potential", "relevance_confidence",
+        "evidence_spans", "anchors_detected",
+    )
+    
     subnet_id: int
     subnet_name: str
     content_type: ContentType
@@ -42,14 +65,22 @@ class PostClassification:
     market_analysis: MarketAnalysis
     impact_potential: ImpactPotential
     relevance_confidence: str  # "high", "medium", "low"
-    evidence_spans: List[str]  # Exact substrings that triggered the decision
-    anchors_detected: List[str]  # BitTensor anchor words found
+    evidence_spans: Tuple[str, ...]  # Exact substrings that triggered the decision
+    anchors_detected: Tuple[str, ...]  # BitTensor anchor words found
     
     def to_canonical_string(self) -> str:
         """Deterministic string for exact matching by validators"""
-        sorted_evidence = "|".join(sorted([s.lower() for s in self.evidence_spans]))
-        sorted_anchors = "|".join(sorted([s.lower() for s in self.anchors_detected]))
-        return f"{self.subnet_id}|{self.content_type.value}|{self.sentiment.value}|{self.technical_quality.value}|{self.market_analysis.value}|{self.impact_potential.value}|{self.relevance_confidence}|{sorted_evidence}|{sorted_anchors}"
+        return "|".join((
+            str(self.subnet_id),
+            self.content_type.value,
+            self.sentiment.value,
+            self.technical_quality.value,
+            self.market_analysis.value,
+            self.impact_potential.value,
+            self.relevance_confidence,
+            "|".join(sorted(map(str.lower, self.evidence_spans))),
+            "|".join(sorted(map(str.lower, self.anchors_detected))),
+        ))
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization or database storage"""
@@ -62,8 +93,8 @@ class PostClassification:
             "market_analysis": self.market_analysis.value,
             "impact_potential": self.impact_potential.value,
             "relevance_confidence": self.relevance_confidence,
-            "evidence_spans": self.evidence_spans,
-            "anchors_detected": self.anchors_detected,
+            "evidence_spans": list(self.evidence_spans),
+            "anchors_detected": list(self.anchors_detected),
         }
     
     def get_tokens_dict(self) -> dict:
@@ -188,222 +219,24 @@ IMPACT_TOOL = {
 }
 
 
-class SubnetRelevanceAnalyzer:
-    """
-    Deterministic X post classifier using atomic tool calls
-    
-    Each classification dimension is decided independently via its own tool call,
-    eliminating compound decision variance.
-    """
-    
-    def __init__(self, model: str = None, api_key: str = None, llm_base: str = None, subnets: List[Dict] = None):
-        """Initialize analyzer with subnet registry and LLM config"""
-        self.subnet_registry = {}
-        
-        # Use provided values or fall back to centralized config
-        if config:
-            self.model = model or config.MODEL
-            self.api_key = api_key or config.API_KEY
-            self.llm_base = llm_base or config.LLM_BASE
-        else:
-            self.model = model
-            self.api_key = api_key
-            self.llm_base = llm_base
-        
-        if not self.api_key:
-            raise ValueError("API_KEY environment variable is required")
-        
-        self.client = OpenAI(base_url=self.llm_base, api_key=self.api_key)
-        
-        # Initialize subnets
-        if subnets:
-            self.subnets = {s["id"]: s for s in subnets}
-            for s in subnets:
-                self.subnet_registry[s["id"]] = s
-        else:
-            self.subnets = {}
-        
-        # Add NONE subnet
-        self.subnets[0] = {
-            "id": 0,
-            "name": "NONE_OF_THE_ABOVE",
-            "description": "General BitTensor content not specific to a listed subnet"
-        }
-        
-        bt.logging.info(f"[ANALYZER] Initialized with model: {self.model}")
-        if subnets:
-            bt.logging.info(f"[ANALYZER] Registered {len(self.subnets)-1} subnets (+1 NONE)")
-    
-    def register_subnet(self, subnet_data: dict):
-        """Register a subnet (backward compatibility)"""
-        subnet_id = subnet_data['id']
-        self.subnet_registry[subnet_id] = subnet_data
-        self.subnets[subnet_id] = subnet_data
-        bt.logging.debug(f"[ANALYZER] Registered subnet {subnet_id}: {subnet_data.get('name')}")
-    
-    def classify_keyword_based(self, text: str) -> Dict:
-        """
-        Keyword-based subnet classification using edit distance for fuzzy matching.
-        
-        Args:
-            text: Post text to classify
-            
-        Returns:
-            Dict with:
-            - is_bittensor: Whether post is BitTensor-related
-            - confidence: 'high' (anchor present) or 'low' (subnet name only, possible false positive)
-            - subnet_scores: {subnet_id: score}
-            - matched_subnets: [(subnet_id, name, score, evidence), ...] sorted by score
-        """
-        text_lower = text.lower()
-        
-        # Check for explicit BitTensor anchors
-        has_anchor = bool(re.search(r'\bsn\d+\b|\bsubnet\b|\bbittensor\b|\btao\b|\$tao\b|\bopentensor\b', text_lower))
-        
-        # Extract words for matching (4+ chars, exclude ecosystem terms)
-        ecosystem = re.compile(r'^(bittensor|opentensor|tao|subnets?|sn\d+)$')
-        words = {w for w in re.findall(r'\b\w{4,}\b', text_lower) if not ecosystem.match(w)}
-        
-        # Find subnet matches
-        matches = []
-        for sid, data in self.subnets.items():
-            if sid == 0:
-                continue
-            
-            # SN pattern match (e.g., SN23, subnet 23) - (?!\d) prevents SN23 matching SN123
-            if re.search(rf'\bsn\s*{sid}(?!\d)|\bsubnet\s+{sid}(?!\d)', text_lower):
-                matches.append((sid, data['name'], 1.0, [f'SN{sid}']))
-                continue
-            
-            # Check name and identifiers
-            best = (0.0, [])
-            for name in [data.get('name', '')] + data.get('unique_identifiers', []):
-                if not name or len(name) < 4 or ecosystem.match(name.lower()):
-                    continue
-                name_lower = name.lower()
-                
-                # Exact match
-                if name_lower in words:
-                    best = (0.9, [name])
-                    break
-                
-                # Fuzzy match (edit distance >= 0.85)
-                for word in words:
-                    sim = SequenceMatcher(None, word, name_lower).ratio()
-                    if sim >= 0.85 and sim > best[0]:
-                        best = (sim * 0.9, [f'{word}≈{name}'])
-            
-            if best[0] >= 0.75:
-                matches.append((sid, data['name'], best[0], best[1]))
-        
-        # Sort by score descending
-        matches.sort(key=lambda x: x[2], reverse=True)
-        
-        # Determine result
-        if not has_anchor and not matches:
-            return {'is_bittensor': False, 'confidence': None, 'subnet_scores': {}, 'matched_subnets': []}
-        
-        return {
-            'is_bittensor': True,
-            'confidence': 'high' if has_anchor else 'low',
-            'subnet_scores': {m[0]: m[2] for m in matches},
-            'matched_subnets': matches
-        }
-    
-    def _build_subnet_context(self) -> str:
-        """Build rich semantic context for subnet identification"""
-        contexts = []
-        for sid in sorted(self.subnets.keys()):
-            if sid == 0:
-                continue
-            s = self.subnets[sid]
-            
-            # Build comprehensive description (no truncation - let LLM handle it)
-            ctx = f"SN{sid} ({s.get('name', 'Unknown')}): {s.get('description', '')}"
-            
-            # Add primary functions if available
-            functions = s.get('primary_functions', [])
-            if functions:
-                ctx += f" | Functions: {', '.join(functions[:4])}"
-            
-            # Add all identifiers (not just first 3)
-            ids = s.get('unique_identifiers', [])
-            if ids:
-                ctx += f" | IDs: {', '.join(ids)}"
-            
-            # Add distinguishing features if available
-            features = s.get('distinguishing_features', [])
-            if features:
-                ctx += f" | Features: {', '.join(features[:3])}"
-            
-            contexts.append(ctx)
-        
-        return '\n'.join(contexts)
-    
-    def classify_post(self, text: str) -> Optional[PostClassification]:
-        """
-        Classify using atomic tool calls for each dimension
-        
-        Args:
-            text: X post text to classify
-            
-        Returns:
-            PostClassification if successful, None if parsing fails
-        """
-        try:
-            # Step 1: Identify subnet (most critical decision)
-            subnet_result = self._identify_subnet(text)
-            
-            # Step 2-6: Classify other dimensions atomically
-            content_type = self._classify_content_type(text)
-            sentiment = self._classify_sentiment(text)
-            technical_quality = self._assess_technical_quality(text)
-            market_analysis = self._classify_market_analysis(text)
-            impact = self._assess_impact(text)
-            
-            # Build final classification
-            return PostClassification(
-                subnet_id=subnet_result['id'],
-                subnet_name=subnet_result['name'],
-                content_type=ContentType(content_type),
-                sentiment=Sentiment(sentiment),
-                technical_quality=TechnicalQuality(technical_quality),
-                market_analysis=MarketAnalysis(market_analysis),
-                impact_potential=ImpactPotential(impact),
-                relevance_confidence=subnet_result['confidence'],
-                evidence_spans=subnet_result['evidence'],
-                anchors_detected=subnet_result['anchors']
-            )
-            
-        except Exception as e:
-            bt.logging.error(f"[ANALYZER] Classification error: {e}")
-            return None
-    
-    def _identify_subnet(self, text: str) -> dict:
-        """Identify subnet using keyword-based matching (no LLM)."""
-        result = self.classify_keyword_based(text)
-        
-        if not result['is_bittensor']:
-            return {'id': 0, 'name': "NONE_OF_THE_ABOVE", 'confidence': "low", 'evidence': [], 'anchors': []}
-        
-        if result['matched_subnets']:
-            top = result['matched_subnets'][0]  # (sid, name, score, evidence)
-            confidence = 'high' if top[2] >= 0.9 else 'medium' if top[2] >= 0.8 else 'low'
-            return {
-                'id': top[0],
-                'name': top[1],
-                'confidence': confidence,
-                'evidence': top[3],
-                'anchors': []
-            }
-        
-        return {'id': 0, 'name': "NONE_OF_THE_ABOVE", 'confidence': "low", 'evidence': [], 'anchors': []}
-    
-    def _classify_content_type(self, text: str) -> str:
-        """Atomic decision: Content type"""
-        prompt = f"""You are classifying a social media post about BitTensor or cryptocurrency. Classify the content type.
+# Keyword classifier patterns (compiled once)
+_ANCHOR_RE = re.compile(r'\bsn\d+\b|\bsubnet\b|\bbittensor\b|\btao\b|\$tao\b|\bopentensor\b')
+_ECOSYSTEM_TERMS = frozenset(('bittensor', 'opentensor', 'tao', 'subnet', 'subnets'))
+# Runs of 4+ word chars; \w{4,} is greedy so word boundaries are implicit
+_WORDS_RE = re.compile(r'\w{4,}')
+
+
+def _is_ecosystem_term(word: str) -> bool:
+    """Generic ecosystem words (bittensor, tao, subnet(s), snNN) that never identify a subnet"""
+    # isdecimal() matches exactly the characters \d does
+    return word in _ECOSYSTEM_TERMS or (word.startswith('sn') and word[2:].isdecimal())
+
+# Explicit subnet mentions (e.g. SN23, subnet 23); \d+ is greedy so SN123 never yields 23
+_SN_MENTION_RE = re.compile(r'\bsn\s*(\d+)|\bsubnet\s+(\d+)')
 
-Post: "{text}"
+# Static instructions for each dimension, sent as the system message. The post itself
+# goes last in a short user message so the long identical prefix can be prompt-cached.
+_CONTENT_TYPE_SYSTEM = """You are classifying a social media post about BitTensor or cryptocurrency. Classify the content type.
 
 Instructions:
 - Choose the MOST SPECIFIC category that best describes this post
@@ -474,25 +307,7 @@ Categories with examples:
 
 Choose the category name that best fits this post."""
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                tools=[CONTENT_TYPE_TOOL],
-                tool_choice={"type": "function", "function": {"name": "classify_content_type"}},
-                temperature=0,
-                max_tokens=50
-            )
-            args = json.loads(response.choices[0].message.tool_calls[0].function.arguments)
-            return args.get("content_type", "other")
-        except:
-            return "other"
-    
-    def _classify_sentiment(self, text: str) -> str:
-        """Atomic decision: Sentiment"""
-        prompt = f"""You are analyzing a social media post about BitTensor or cryptocurrency. Classify the market sentiment.
-
-Post text: "{text}"
+_SENTIMENT_SYSTEM = """You are analyzing a social media post about BitTensor or cryptocurrency. Classify the market sentiment.
 
 Analyze the overall tone and implied market outlook. Consider:
 - Explicit sentiment indicators (emojis, language)
@@ -528,25 +343,7 @@ Sentiment categories:
 
 Choose the category that best matches the post's sentiment. Be precise - distinguish between bullish (measured) and very_bullish (extreme). Consider the implied market impact and tone, not just explicit price mentions."""
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                tools=[SENTIMENT_TOOL],
-                tool_choice={"type": "function", "function": {"name": "classify_sentiment"}},
-                temperature=0,
-                max_tokens=50
-            )
-            args = json.loads(response.choices[0].message.tool_calls[0].function.arguments)
-            return args.get("sentiment", "neutral")
-        except:
-            return "neutral"
-    
-    def _assess_technical_quality(self, text: str) -> str:
-        """Atomic decision: Technical quality"""
-        prompt = f"""Assess the technical quality and specificity of this post.
-
-Post: "{text}"
+_TECHNICAL_QUALITY_SYSTEM = """Assess the technical quality and specificity of this post.
 
 Rate based on how many concrete, verifiable technical details are present:
 
@@ -572,25 +369,7 @@ Rate based on how many concrete, verifiable technical details are present:
 
 Count only verifiable, objective technical details (versions, metrics, protocols, algorithms). Subjective claims like "fast" or "secure" don't count unless quantified. General buzzwords don't count."""
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                tools=[TECHNICAL_QUALITY_TOOL],
-                tool_choice={"type": "function", "function": {"name": "assess_technical_quality"}},
-                temperature=0,
-                max_tokens=50
-            )
-            args = json.loads(response.choices[0].message.tool_calls[0].function.arguments)
-            return args.get("quality", "none")
-        except:
-            return "none"
-    
-    def _classify_market_analysis(self, text: str) -> str:
-        """Atomic decision: Market analysis type"""
-        prompt = f"""Classify the type of market analysis in this post, if any.
-
-Post: "{text}"
+_MARKET_ANALYSIS_SYSTEM = """Classify the type of market analysis in this post, if any.
 
 Only classify as a market analysis type if the post contains analytical reasoning about market dynamics. If the post just mentions price without analysis, choose "other".
 
@@ -622,25 +401,7 @@ Categories:
 
 If post just mentions price without analytical reasoning about market dynamics, choose "other". The post must analyze why/how market factors affect value."""
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                tools=[MARKET_ANALYSIS_TOOL],
-                tool_choice={"type": "function", "function": {"name": "classify_market_analysis"}},
-                temperature=0,
-                max_tokens=50
-            )
-            args = json.loads(response.choices[0].message.tool_calls[0].function.arguments)
-            return args.get("analysis_type", "other")
-        except:
-            return "other"
-    
-    def _assess_impact(self, text: str) -> str:
-        """Atomic decision: Impact potential"""
-        prompt = f"""Assess the potential impact this post's content would have on the BitTensor ecosystem.
-
-Post: "{text}"
+_IMPACT_SYSTEM = """Assess the potential impact this post's content would have on the BitTensor ecosystem.
 
 Evaluate based on how significant the news/information would be to the ecosystem. Consider:
 - Scope: How many users/projects would be affected?
@@ -671,19 +432,622 @@ Impact levels:
 
 Focus on the information's potential to affect the BitTensor ecosystem, not just engagement levels. News that affects multiple subnets or fundamental operations = HIGH. Routine updates = MEDIUM/LOW."""
 
+# Per-dimension LLM decisions: (dimension, system prompt, tool, result key, default)
+_DIMENSIONS = (
+    ("content_type", _CONTENT_TYPE_SYSTEM, CONTENT_TYPE_TOOL, "content_type", "other"),
+    ("sentiment", _SENTIMENT_SYSTEM, SENTIMENT_TOOL, "sentiment", "neutral"),
+    ("technical_quality", _TECHNICAL_QUALITY_SYSTEM, TECHNICAL_QUALITY_TOOL, "quality", "none"),
+    ("market_analysis", _MARKET_ANALYSIS_SYSTEM, MARKET_ANALYSIS_TOOL, "analysis_type", "other"),
+    ("impact", _IMPACT_SYSTEM, IMPACT_TOOL, "impact", "NONE"),
+)
+
+_DIMENSION_BY_NAME = {d[0]: d for d in _DIMENSIONS}
+# Dimension values used when no LLM decision is made (e.g. non-BitTensor posts)
+_DEFAULT_VALUES = {dim: default for dim, _, _, _, default in _DIMENSIONS}
+# Allowed labels per dimension, taken from each tool's enum
+_DIMENSION_LABELS = {
+    dim: frozenset(tool["function"]["parameters"]["properties"][key]["enum"])
+    for dim, _, tool, key, _ in _DIMENSIONS
+}
+
+
+# Single tool covering every LLM dimension (non-atomic mode): field name per dimension
+_UNIFIED_FIELDS = {
+    "content_type": "content_type",
+    "sentiment": "sentiment",
+    "technical_quality": "technical_quality",
+    "market_analysis": "market_analysis",
+    "impact": "impact_potential",
+}
+
+UNIFIED_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "classify_all",
+        "description": "Classify the post on every dimension at once",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                _UNIFIED_FIELDS[dim]: dict(tool["function"]["parameters"]["properties"][key])
+                for dim, _, tool, key, _ in _DIMENSIONS
+            },
+            "required": [_UNIFIED_FIELDS[dim] for dim, _, _, _, _ in _DIMENSIONS]
+        }
+    }
+}
+
+_UNIFIED_SYSTEM = (
+    "Classify the social media post on each of the following dimensions independently, "
+    "then call classify_all with one value per field.\n\n"
+    + "\n\n".join(
+        f"## {_UNIFIED_FIELDS[dim]}\n{system_prompt}"
+        for dim, system_prompt, _, _, _ in _DIMENSIONS
+    )
+)
+
+
+def _loads(raw):
+    """Parse LLM tool-call JSON, with orjson when available (stdlib for what orjson rejects, e.g. NaN)"""
+    if orjson is not None:
         try:
-            response = self.client.chat.completions.create(
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _prompt_text(text: str) -> str:
+    """
+    Post text as sent to the LLM, with whitespace runs collapsed.
+    
+    Reposts that differ only in spacing/line breaks then produce identical requests and
+    share a cache entry, while staying a pure function of the text (miners and
+    validators still see the same prompt for the same post).
+    """
+    return " ".join(text.split())
+
+
+def _dedupe(texts: List[str]):
+    """
+    Collapse duplicate posts in a batch.
+    
+    Returns (unique_texts, positions) where texts[i] maps to unique_texts[positions[i]].
+    """
+    unique: List[str] = []
+    slot: Dict[str, int] = {}
+    positions = []
+    for text in texts:
+        pos = slot.get(text)
+        if pos is None:
+            pos = slot[text] = len(unique)
+            unique.append(text)
+        positions.append(pos)
+    return unique, positions
+
+
+def _dimension_messages(system_prompt: str, text: str) -> List[Dict[str, str]]:
+    """Static instructions first, post text last (maximizes provider prefix caching)"""
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": f'Post: "{_prompt_text(text)}"'},
+    ]
+
+# Per-dimension decision cache
+DECISION_CACHE_MAXSIZE = 10000
+DECISION_CACHE_TTL = 3600  # seconds
+
+# Posts classified concurrently; each fans out up to 5 dimension calls
+POST_CONCURRENCY = 4
+
+# Transient LLM errors worth retrying with exponential backoff ("full jitter": each wait is
+# drawn uniformly from [0, LLM_BACKOFF_BASE * 2^attempt] so worker threads that hit the same
+# rate limit don't retry in lockstep)
+_RETRYABLE_LLM_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError)
+LLM_MAX_ATTEMPTS = 3
+LLM_BACKOFF_BASE = 0.5
+
+
+class SubnetRelevanceAnalyzer:
+    """
+    Deterministic X post classifier using atomic tool calls
+    
+    Each classification dimension is decided independently via its own tool call,
+    eliminating compound decision variance.
+    """
+    
+    def __init__(self, model: str = None, api_key: str = None, llm_base: str = None, subnets: List[Dict] = None,
+                 atomic: bool = None):
+        """
+        Initialize analyzer with subnet registry and LLM config
+        
+        Args:
+            atomic: One tool call per dimension (True) or a single classify_all call per
+                post (False). Defaults to config.ANALYZER_ATOMIC_CLASSIFICATION.
+        """
+        self.subnet_registry = {}
+        if atomic is None:
+            atomic = config.ANALYZER_ATOMIC_CLASSIFICATION if config else True
+        self.atomic = atomic
+        
+        # Use provided values or fall back to centralized config
+        if config:
+            self.model = model or config.MODEL
+            self.api_key = api_key or config.API_KEY
+            self.llm_base = llm_base or config.LLM_BASE
+        else:
+            self.model = model
+            self.api_key = api_key
+            self.llm_base = llm_base
+        
+        if not self.api_key:
+            raise ValueError("API_KEY environment variable is required")
+        
+        # One pooled HTTP/2 client so concurrent dimension calls share keep-alive
+        # connections instead of paying a TLS handshake each
+        self._http_client = httpx.Client(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            http2=True,
+            # Fail fast on unreachable endpoints so the retry/backoff loop takes over
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+        self.client = OpenAI(base_url=self.llm_base, api_key=self.api_key, http_client=self._http_client)
+        
+        # The five per-dimension LLM calls are independent, so they run concurrently;
+        # sized for POST_CONCURRENCY posts in flight at once
+        self._executor = ThreadPoolExecutor(max_workers=5 * POST_CONCURRENCY, thread_name_prefix="analyzer")
+        # Separate pool for whole posts: classify_post() blocks on _executor, so sharing
+        # one pool could starve it
+        self._post_executor = ThreadPoolExecutor(max_workers=POST_CONCURRENCY, thread_name_prefix="analyzer-post")
+        
+        # Exact-match TTL+LRU cache of LLM decisions, keyed by sha256(model, messages, tool)
+        self._llm_cache = LLMResponseCache(maxsize=DECISION_CACHE_MAXSIZE, ttl=DECISION_CACHE_TTL)
+        
+        # Optional local sentiment model replacing the sentiment LLM call. A configured
+        # model that fails to load is fatal: quietly using the LLM instead would change
+        # this node's sentiment labels without the operator noticing
+        self._local_sentiment = None
+        if config and config.SENTIMENT_BACKEND == "local":
+            self._local_sentiment = LocalSentimentClassifier(config.SENTIMENT_MODEL)
+        
+        # Initialize subnets
+        if subnets:
+            self.subnets = {s["id"]: s for s in subnets}
+            for s in subnets:
+                self.subnet_registry[s["id"]] = s
+        else:
+            self.subnets = {}
+        
+        # Add NONE subnet
+        self.subnets[0] = {
+            "id": 0,
+            "name": "NONE_OF_THE_ABOVE",
+            "description": "General BitTensor content not specific to a listed subnet"
+        }
+        
+        # Pre-lowercased name/identifier index for fuzzy matching
+        self._build_name_index()
+        self._subnet_context_cache: Optional[str] = None
+        
+        bt.logging.info(f"[ANALYZER] Initialized with model: {self.model}")
+        if subnets:
+            bt.logging.info(f"[ANALYZER] Registered {len(self.subnets)-1} subnets (+1 NONE)")
+    
+    def register_subnet(self, subnet_data: dict):
+        """Register a subnet (backward compatibility)"""
+        subnet_id = subnet_data['id']
+        is_new = subnet_id not in self.subnets
+        self.subnet_registry[subnet_id] = subnet_data
+        self.subnets[subnet_id] = subnet_data
+        if is_new:
+            # Appended at the end of self.subnets, so the index can grow in place
+            self._index_subnet(subnet_id, subnet_data)
+        else:
+            self._build_name_index()
+        self._subnet_context_cache = None
+        if is_enabled_for(logging.DEBUG):
+            bt.logging.debug(f"[ANALYZER] Registered subnet {subnet_id}: {subnet_data.get('name')}")
+    
+    def _build_name_index(self):
+        """
+        Precompute, per subnet, the matchable (name, name_lower, column) entries, the
+        flat list of lowercased names used as the fuzzy-match column axis, and an
+        exact-match table {name_lower: [(sid, entry_index), ...]}.
+        """
+        self._fuzzy_names: List[str] = []
+        self._col_sid: List[int] = []
+        self._subnet_names: Dict[int, List[tuple]] = {}
+        self._exact_names: Dict[str, List[tuple]] = {}
+        self._sid_by_str: Dict[str, int] = {}
+        self._sids_by_len: Dict[int, set] = {}
+        self._subnet_ctx_lines: Dict[int, str] = {}
+        for sid, data in self.subnets.items():
+            self._index_subnet(sid, data)
+    
+    def _index_subnet(self, sid: int, data: dict):
+        """Add one subnet's names to the match indexes (names are lowercased once, here)"""
+        if sid == 0:
+            return
+        self._sid_by_str[str(sid)] = sid
+        self._subnet_ctx_lines[sid] = self._subnet_context_line(sid, data)
+        entries = []
+        for name in [data.get('name', '')] + data.get('unique_identifiers', []):
+            if not name or len(name) < 4:
+                continue
+            name_lower = name.lower()
+            if _is_ecosystem_term(name_lower):
+                continue
+            self._exact_names.setdefault(name_lower, []).append((sid, len(entries)))
+            entries.append((name, name_lower, len(self._fuzzy_names)))
+            self._fuzzy_names.append(name_lower)
+            self._col_sid.append(sid)
+            self._sids_by_len.setdefault(len(name_lower), set()).add(sid)
+        self._subnet_names[sid] = entries
+    
+    def _fuzzy_candidates(self, words_list: List[str]):
+        """
+        Return {column: [word, ...]} of words that could reach a 0.85 similarity with each name.
+        
+        rapidfuzz's Indel ratio (LCS based) is an upper bound on SequenceMatcher.ratio(), so
+        using it as a C-level prefilter yields exactly the same matches as scanning every pair.
+        Returns None when rapidfuzz isn't installed.
+        """
+        if _rf_process is None or not words_list or not self._fuzzy_names:
+            return None
+        scores = _rf_process.cdist(words_list, self._fuzzy_names, scorer=_rf_fuzz.ratio, score_cutoff=84.9)
+        candidates: Dict[int, List[str]] = {}
+        for i, j in zip(*scores.nonzero()):
+            candidates.setdefault(int(j), []).append(words_list[i])
+        return candidates
+    
+    def classify_keyword_based(self, text: str) -> Dict:
+        """
+        Keyword-based subnet classification using edit distance for fuzzy matching.
+        
+        Args:
+            text: Post text to classify
+            
+        Returns:
+            Dict with:
+            - is_bittensor: Whether post is BitTensor-related
+            - confidence: 'high' (anchor present) or 'low' (subnet name only, possible false positive)
+            - subnet_scores: {subnet_id: score}
+            - matched_subnets: [(subnet_id, name, score, evidence), ...] sorted by score
+        """
+        text_lower = text.lower()
+        
+        # Check for explicit BitTensor anchors
+        has_anchor = bool(_ANCHOR_RE.search(text_lower))
+        
+        # Extract words for matching (4+ chars, exclude ecosystem terms)
+        words = {w for w in _WORDS_RE.findall(text_lower) if not _is_ecosystem_term(w)}
+        
+        # All explicit SN mentions in one scan, compared as digit strings so "sn023" != SN23
+        mentioned_sids = {a or b for a, b in _SN_MENTION_RE.findall(text_lower)}
+        
+        # Exact word hits for all subnets in one pass over the post's words:
+        # {sid: index of the first matching name/identifier}
+        exact_hits: Dict[int, int] = {}
+        for word in words:
+            for sid, idx in self._exact_names.get(word, ()):
+                if idx < exact_hits.get(sid, idx + 1):
+                    exact_hits[sid] = idx
+        
+        # Find subnet matches
+        words_list = list(words)
+        candidates = self._fuzzy_candidates(words_list)
+        # Length window for the fuzzy pass: ratio = 2*M/(len_a+len_b) and M <= the shorter
+        # length, so a name can only reach 0.85 against the nearest post-word length
+        if words_list:
+            min_w = min(map(len, words_list))
+            max_w = max(map(len, words_list))
+        else:
+            min_w = max_w = 0
+        # Only subnets with an SN mention, an exact hit or a possible fuzzy hit can match;
+        # everything else is skipped without touching its names. Possible fuzzy hits come
+        # from the rapidfuzz candidates, or without rapidfuzz from the length index (a name
+        # can only reach 0.85 against a word of compatible length).
+        # Iteration order is kept so equal-score ties sort exactly as before.
+        relevant = {self._sid_by_str[m] for m in mentioned_sids if m in self._sid_by_str}
+        relevant.update(exact_hits)
+        if candidates is not None:
+            relevant.update(self._col_sid[col] for col in candidates)
+        else:
+            word_lens = {len(w) for w in words_list}
+            for n, sids in self._sids_by_len.items():
+                if any(2.0 * min(n, w) / (n + w) >= 0.85 for w in word_lens):
+                    relevant.update(sids)
+        matcher = SequenceMatcher(None)
+        matches = []
+        for sid, data in self.subnets.items():
+            if sid not in relevant:
+                continue
+            
+            # SN pattern match (e.g., SN23, subnet 23) - (?!\d) prevents SN23 matching SN123
+            if str(sid) in mentioned_sids:
+                matches.append((sid, data['name'], 1.0, [f'SN{sid}']))
+                continue
+            
+            # Exact match on the name or any identifier (first one in order wins)
+            if sid in exact_hits:
+                matches.append((sid, data['name'], 0.9, [self._subnet_names[sid][exact_hits[sid]][0]]))
+                continue
+            
+            # Check name and identifiers
+            best = (0.0, [])
+            for name, name_lower, col in self._subnet_names.get(sid, ()):
+                n = len(name_lower)
+                if not max_w or (n > max_w and 2.0 * max_w / (max_w + n) < 0.85) or (
+                    n < min_w and 2.0 * n / (min_w + n) < 0.85
+                ):
+                    continue
+                # Fuzzy match (edit distance >= 0.85); only prefiltered candidates
+                # need the full SequenceMatcher ratio
+                if candidates is not None:
+                    pool = candidates.get(col, ())
+                else:
+                    pool = words_list
+                matcher.set_seq2(name_lower)
+                for word in pool:
+                    matcher.set_seq1(word)
+                    if candidates is None and matcher.real_quick_ratio() < 0.85:
+                        continue
+                    sim = matcher.ratio()
+                    if sim >= 0.85 and sim > best[0]:
+                        best = (sim * 0.9, [f'{word}≈{name}'])
+            
+            if best[0] >= 0.75:
+                matches.append((sid, data['name'], best[0], best[1]))
+        
+        # Sort by score descending
+        matches.sort(key=lambda x: x[2], reverse=True)
+        
+        # Determine result
+        if not has_anchor and not matches:
+            return {'is_bittensor': False, 'confidence': None, 'subnet_scores': {}, 'matched_subnets': []}
+        
+        return {
+            'is_bittensor': True,
+            'confidence': 'high' if has_anchor else 'low',
+            'subnet_scores': {m[0]: m[2] for m in matches},
+            'matched_subnets': matches
+        }
+    
+    def _build_subnet_context(self) -> str:
+        """Build rich semantic context for subnet identification (cached until a subnet is registered)"""
+        if self._subnet_context_cache is None:
+            lines = self._subnet_ctx_lines
+            self._subnet_context_cache = '\n'.join(lines[sid] for sid in sorted(lines))
+        return self._subnet_context_cache
+    
+    @staticmethod
+    def _subnet_context_line(sid: int, s: dict) -> str:
+        """One subnet's context line; rendered once at registration"""
+        # Build comprehensive description (no truncation - let LLM handle it)
+        ctx = f"SN{sid} ({s.get('name', 'Unknown')}): {s.get('description', '')}"
+        
+        # Add primary functions if available
+        functions = s.get('primary_functions', [])
+        if functions:
+            ctx += f" | Functions: {', '.join(functions[:4])}"
+        
+        # Add all identifiers (not just first 3)
+        ids = s.get('unique_identifiers', [])
+        if ids:
+            ctx += f" | IDs: {', '.join(ids)}"
+        
+        # Add distinguishing features if available
+        features = s.get('distinguishing_features', [])
+        if features:
+            ctx += f" | Features: {', '.join(features[:3])}"
+        
+        return ctx
+    
+    def classify_post(self, text: str) -> Optional[PostClassification]:
+        """
+        Classify using atomic tool calls for each dimension
+        
+        Args:
+            text: X post text to classify
+            
+        Returns:
+            PostClassification if successful, None if parsing fails
+        """
+        try:
+            # Step 1: Identify subnet (most critical decision)
+            subnet_result = self._identify_subnet(text)
+            
+            # Not BitTensor-related: the remaining dimensions are irrelevant, skip the LLM
+            if not subnet_result['is_bittensor']:
+                return self._make_classification(subnet_result, _DEFAULT_VALUES)
+            
+            if not self.atomic:
+                return self._make_classification(subnet_result, self._classify_unified(text))
+            
+            # Step 2-6: Classify other dimensions atomically (one tool call each, in parallel)
+            futures = [
+                self._executor.submit(fn, text)
+                for fn in (
+                    self._classify_content_type,
+                    self._classify_sentiment,
+                    self._assess_technical_quality,
+                    self._classify_market_analysis,
+                    self._assess_impact,
+                )
+            ]
+            values = dict(zip((d[0] for d in _DIMENSIONS), [f.result() for f in futures]))
+            
+            # Build final classification
+            return self._make_classification(subnet_result, values)
+            
+        except Exception as e:
+            bt.logging.error(f"[ANALYZER] Classification error: {e}")
+            return None
+    
+    @staticmethod
+    def _make_classification(subnet_result: dict, values: Dict[str, str]) -> PostClassification:
+        """Assemble a PostClassification from the subnet decision and per-dimension values"""
+        return PostClassification(
+            subnet_id=subnet_result['id'],
+            subnet_name=subnet_result['name'],
+            content_type=ContentType.from_value(values["content_type"]),
+            sentiment=Sentiment.from_value(values["sentiment"]),
+            technical_quality=TechnicalQuality.from_value(values["technical_quality"]),
+            market_analysis=MarketAnalysis.from_value(values["market_analysis"]),
+            impact_potential=ImpactPotential.from_value(values["impact"]),
+            relevance_confidence=subnet_result['confidence'],
+            evidence_spans=tuple(subnet_result['evidence']),
+            anchors_detected=tuple(subnet_result['anchors'])
+        )
+    
+    def _identify_subnet(self, text: str) -> dict:
+        """Identify subnet using keyword-based matching (no LLM)."""
+        result = self.classify_keyword_based(text)
+        
+        if not result['is_bittensor']:
+            return {'id': 0, 'name': "NONE_OF_THE_ABOVE", 'confidence': "low", 'evidence': [], 'anchors': [],
+                    'is_bittensor': False}
+        
+        if result['matched_subnets']:
+            top = result['matched_subnets'][0]  # (sid, name, score, evidence)
+            confidence = 'high' if top[2] >= 0.9 else 'medium' if top[2] >= 0.8 else 'low'
+            return {
+                'id': top[0],
+                'name': top[1],
+                'confidence': confidence,
+                'evidence': top[3],
+                'anchors': [],
+                'is_bittensor': True
+            }
+        
+        return {'id': 0, 'name': "NONE_OF_THE_ABOVE", 'confidence': "low", 'evidence': [], 'anchors': [],
+                'is_bittensor': True}
+    
+    def _create_completion(self, **kwargs):
+        """Chat completion with jittered exponential backoff on rate limits and timeouts"""
+        for attempt in range(LLM_MAX_ATTEMPTS):
+            try:
+                return self.client.chat.completions.create(**kwargs)
+            except _RETRYABLE_LLM_ERRORS as e:
+                if attempt == LLM_MAX_ATTEMPTS - 1:
+                    raise
+                delay = random.uniform(0, LLM_BACKOFF_BASE * (2 ** attempt))
+                bt.logging.debug(f"[ANALYZER] LLM call failed ({type(e).__name__}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+    
+    def _classify_dimension(self, dim: str, text: str) -> str:
+        """
+        Run one atomic tool-call decision, served from the exact-match cache when possible.
+        
+        Falls back to the dimension's default on any LLM/parse failure; failures are not cached.
+        """
+        if dim == "sentiment" and self._local_sentiment is not None:
+            return self._local_sentiment.classify_many([text])[0]
+        _, system_prompt, tool, result_key, default = _DIMENSION_BY_NAME[dim]
+        key = self._decision_key(dim, text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = self._create_completion(
                 model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                tools=[IMPACT_TOOL],
-                tool_choice={"type": "function", "function": {"name": "assess_impact"}},
+                messages=_dimension_messages(system_prompt, text),
+                tools=[tool],
+                tool_choice={"type": "function", "function": {"name": tool["function"]["name"]}},
                 temperature=0,
                 max_tokens=50
             )
-            args = json.loads(response.choices[0].message.tool_calls[0].function.arguments)
-            return args.get("impact", "NONE")
-        except:
-            return "NONE"
+            args = _loads(response.choices[0].message.tool_calls[0].function.arguments)
+            value = args[result_key]
+            if value not in _DIMENSION_LABELS[dim]:
+                raise ValueError(f"unexpected label {value!r}")
+        except APIError as e:
+            bt.logging.warning(f"[ANALYZER] {dim} LLM call failed: {type(e).__name__}: {e}")
+            return default
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            # Malformed/missing tool call or label outside the enum (json errors are ValueErrors)
+            bt.logging.warning(f"[ANALYZER] {dim} tool-call parse failed: {type(e).__name__}: {e}")
+            return default
+        
+        self._cache_put(key, value)
+        return value
+    
+    def _classify_unified(self, text: str) -> Dict[str, str]:
+        """
+        Classify every LLM dimension with one classify_all tool call.
+        
+        Fields that are missing or outside their enum fall back to the dimension default;
+        an LLM/parse failure returns all defaults. Successful calls are cached.
+        """
+        key = self._decision_key("unified", text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = self._create_completion(
+                model=self.model,
+                messages=_dimension_messages(_UNIFIED_SYSTEM, text),
+                tools=[UNIFIED_TOOL],
+                tool_choice={"type": "function", "function": {"name": "classify_all"}},
+                temperature=0,
+                max_tokens=200
+            )
+            args = _loads(response.choices[0].message.tool_calls[0].function.arguments)
+        except APIError as e:
+            bt.logging.warning(f"[ANALYZER] classify_all LLM call failed: {type(e).__name__}: {e}")
+            return dict(_DEFAULT_VALUES)
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            bt.logging.warning(f"[ANALYZER] classify_all tool-call parse failed: {type(e).__name__}: {e}")
+            return dict(_DEFAULT_VALUES)
+        
+        values = {}
+        for dim, _, _, _, default in _DIMENSIONS:
+            value = args.get(_UNIFIED_FIELDS[dim]) if isinstance(args, dict) else None
+            values[dim] = value if value in _DIMENSION_LABELS[dim] else default
+        self._cache_put(key, values)
+        return dict(values)
+    
+    def _decision_key(self, dim: str, text: str) -> str:
+        """Cache key of the single-post request for a dimension (or "unified" for classify_all)"""
+        if dim == "unified":
+            return make_key(self.model, _dimension_messages(_UNIFIED_SYSTEM, text), "classify_all")
+        _, system_prompt, tool, _, _ = _DIMENSION_BY_NAME[dim]
+        return make_key(self.model, _dimension_messages(system_prompt, text), tool["function"]["name"])
+    
+    def _cache_get(self, key: str):
+        return self._llm_cache.get(key)
+    
+    def _cache_put(self, key: str, value):
+        self._llm_cache.put(key, value)
+    
+    def get_cache_stats(self) -> dict:
+        """Hit/miss counters for the LLM decision cache"""
+        return self._llm_cache.stats()
+    
+    def _classify_content_type(self, text: str) -> str:
+        """Atomic decision: Content type"""
+        return self._classify_dimension("content_type", text)
+    
+    def _classify_sentiment(self, text: str) -> str:
+        """Atomic decision: Sentiment"""
+        return self._classify_dimension("sentiment", text)
+    
+    def _assess_technical_quality(self, text: str) -> str:
+        """Atomic decision: Technical quality"""
+        return self._classify_dimension("technical_quality", text)
+    
+    def _classify_market_analysis(self, text: str) -> str:
+        """Atomic decision: Market analysis type"""
+        return self._classify_dimension("market_analysis", text)
+    
+    def _assess_impact(self, text: str) -> str:
+        """Atomic decision: Impact potential"""
+        return self._classify_dimension("impact", text)
+    
+    def submit_classification(self, text: str) -> Future:
+        """classify_post(text) scheduled on the shared post pool (POST_CONCURRENCY at a time)"""
+        return self._post_executor.submit(self.classify_post, text)
     
     def analyze_post_complete(self, text: str) -> dict:
         """
@@ -692,7 +1056,9 @@ Focus on the information's potential to affect the BitTensor ecosystem, not just
         Maintains backward compatibility with existing interface.
         """
         start_time = time.time()
-        bt.logging.info(f"[ANALYZER] Starting analysis for post (length: {len(text)} chars)")
+        log_info = is_enabled_for(logging.INFO)
+        if log_info:
+            bt.logging.info(f"[ANALYZER] Starting analysis for post (length: {len(text)} chars)")
         
         # Run atomic classification
         classification = self.classify_post(text)
@@ -705,6 +1071,8 @@ Focus on the information's potential to affect the BitTensor ecosystem, not just
                 "timestamp": datetime.now().isoformat()
             }
         
+        sentiment_value = classification.sentiment.value
+        
         # Build subnet_relevance dict
         subnet_relevance = {}
         if classification.subnet_id != 0:
@@ -715,16 +1083,19 @@ Focus on the information's potential to affect the BitTensor ecosystem, not just
                 "relevance": 1.0,
                 "relevance_confidence": classification.relevance_confidence,
                 "content_type": classification.content_type.value,
-                "sentiment": classification.sentiment.value,
+                "sentiment": sentiment_value,
                 "technical_quality": classification.technical_quality.value,
                 "market_analysis": classification.market_analysis.value,
                 "impact_potential": classification.impact_potential.value,
-                "evidence_spans": classification.evidence_spans,
-                "anchors_detected": classification.anchors_detected,
+                "evidence_spans": list(classification.evidence_spans),
+                "anchors_detected": list(classification.anchors_detected),
             }
         
-        total_time = time.time() - start_time
-        bt.logging.info(f"[ANALYZER] Analysis completed in {total_time:.2f}s")
+        if log_info:
+            bt.logging.info(f"[ANALYZER] Analysis completed in {time.time() - start_time:.2f}s")
+        if is_enabled_for(logging.DEBUG):
+            stats = self._llm_cache.stats()
+            bt.logging.debug(f"[ANALYZER] LLM cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%})")
         
         # Sentiment mapping for backward compatibility
         sentiment_to_float = {
@@ -734,7 +1105,7 @@ Focus on the information's potential to affect the BitTensor ecosystem, not just
             "bearish": -0.5,
             "very_bearish": -1.0
         }
-        sentiment_enum = classification.sentiment.value if classification else "neutral"
+        sentiment_enum = sentiment_value
         sentiment_float = sentiment_to_float.get(sentiment_enum, 0.0)
         
         return {
@@ -745,6 +1116,27 @@ Focus on the information's potential to affect the BitTensor ecosystem, not just
             "timestamp": datetime.now().isoformat()
         }
     
+    def analyze_posts_each(self, texts: List[str]) -> List[dict]:
+        """
+        Analyze many posts with the single-post prompts, POST_CONCURRENCY at a time.
+        
+        Results are identical to calling analyze_post_complete() on each text, so this
+        is the batch path to use when output is compared against other nodes.
+        """
+        # Identical texts (e.g. the same trending post from several miners) are analyzed once
+        unique, positions = _dedupe(texts)
+        if len(unique) <= 1:
+            analyses = [self.analyze_post_complete(text) for text in unique]
+        else:
+            analyses = list(self._post_executor.map(self.analyze_post_complete, unique))
+        # Hand each duplicate its own (shallow) copy of the result dict
+        seen = set()
+        results = []
+        for pos in positions:
+            results.append(dict(analyses[pos]) if pos in seen else analyses[pos])
+            seen.add(pos)
+        return results
+    
     def _parse_classification(self, args: dict) -> Optional[PostClassification]:
         """Parse and validate function call arguments (backward compatibility)"""
         try:
@@ -753,18 +1145,23 @@ Focus on the information's potential to affect the BitTensor ecosystem, not just
                 bt.logging.warning(f"[ANALYZER] Unknown subnet_id: {subnet_id}")
                 return None
             
-            return PostClassification(
-                subnet_id=subnet_id,
-                subnet_name=self.subnets[subnet_id]["name"],
-                content_type=ContentType(args["content_type"]),
-                sentiment=Sentiment(args["sentiment"]),
-                technical_quality=TechnicalQuality(args["technical_quality"]),
-                market_analysis=MarketAnalysis(args["market_analysis"]),
-                impact_potential=ImpactPotential(args["impact_potential"]),
-                relevance_confidence=args["relevance_confidence"],
-                evidence_spans=args.get("evidence_spans", []),
-                anchors_detected=args.get("anchors_detected", [])
-            )
-        except (ValueError, KeyError) as e:
+            # Labels outside a dimension's enum (e.g. "positive" for sentiment) fall back to
+            # that dimension's default instead of discarding the whole classification
+            values = {}
+            for dim, _, _, _, default in _DIMENSIONS:
+                value = args.get(_UNIFIED_FIELDS[dim], default)
+                if value not in _DIMENSION_LABELS[dim]:
+                    bt.logging.warning(f"[ANALYZER] Invalid {dim} label {value!r}, using {default!r}")
+                    value = default
+                values[dim] = value
+            
+            return self._make_classification({
+                'id': subnet_id,
+                'name': self.subnets[subnet_id]["name"],
+                'confidence': args["relevance_confidence"],
+                'evidence': args.get("evidence_spans", []),
+                'anchors': args.get("anchors_detected", []),
+            }, values)
+        except (ValueError, KeyError, TypeError) as e:
             bt.logging.error(f"[ANALYZER] Parse error: {e}")
             return None
@@ -16,10 +16,19 @@ Validator Flow:
 from datetime import datetime, timezone
 from typing import Dict, List, Tuple
 import random
+import sys
 import bittensor as bt
 
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = None
+
 from .relevance import SubnetRelevanceAnalyzer, PostClassification
 
+# datetime.fromisoformat() only understands a trailing "Z" from Python 3.11 on
+_FROMISO_NEEDS_Z_FIX = sys.version_info < (3, 11)
+
 
 # ===== Normalization Caps =====
 CAPS = {
@@ -31,6 +40,21 @@ CAPS = {
     "account_age_days": 7 * 365,
 }
 
+# Engagement columns in value_score() order, with their CAPS keys
+_VALUE_COLUMNS = (
+    ("like_count", "likes"),
+    ("retweet_count", "retweets"),
+    ("quote_count", "quotes"),
+    ("reply_count", "replies"),
+    ("author_followers", "followers"),
+)
+# Default caps in _VALUE_COLUMNS order, resolved once at import
+_CAP_VALUES = tuple(CAPS[cap] for _, cap in _VALUE_COLUMNS)
+
+
+def _cap_values(caps: Dict) -> Tuple:
+    return _CAP_VALUES if caps is CAPS else tuple(caps[cap] for _, cap in _VALUE_COLUMNS)
+
 
 def _clamp01(x: float) -> float:
     """Clamp a float value to the range [0.0, 1.0]"""
@@ -51,19 +75,34 @@ def _norm(value: float, cap: float) -> float:
     return _clamp01(value / cap)
 
 
-def recency_score(post_date_iso: str, horizon_hours: float = 24.0) -> float:
+def _parse_post_date(post_date_iso: str) -> datetime:
+    """Parse an ISO date (trailing "Z" allowed) into an aware UTC datetime"""
+    if _parse_iso is not None:
+        try:
+            return _parse_iso(post_date_iso).astimezone(timezone.utc)
+        except ValueError:
+            pass
+    if _FROMISO_NEEDS_Z_FIX and post_date_iso.endswith("Z"):
+        post_date_iso = post_date_iso[:-1] + "+00:00"
+    return datetime.fromisoformat(post_date_iso).astimezone(timezone.utc)
+
+
+def recency_score(post_date_iso: str, horizon_hours: float = 24.0, now: datetime = None) -> float:
     """
     Compute recency score based on post age using linear time decay
     
     Args:
         post_date_iso: ISO format date string (e.g., "2024-01-01T12:00:00Z")
         horizon_hours: Time window in hours (default: 24.0)
+        now: Reference time (aware UTC); pass one value when scoring a batch.
+            Defaults to the current time.
         
     Returns:
         Recency score in [0.0, 1.0]
     """
-    dt = datetime.fromisoformat(post_date_iso.replace("Z", "+00:00")).astimezone(timezone.utc)
-    age_hours = (datetime.now(timezone.utc) - dt).total_seconds() / 3600.0
+    if now is None:
+        now = datetime.now(timezone.utc)
+    age_hours = (now - _parse_post_date(post_date_iso)).total_seconds() / 3600.0
     return _clamp01(1.0 - age_hours / horizon_hours)
 
 
@@ -95,24 +134,42 @@ def value_score(
     Returns:
         Value score in [0.0, 1.0]
     """
-    comps = [
-        _norm(like_count or 0, caps["likes"]),
-        _norm(retweet_count or 0, caps["retweets"]),
-        _norm(quote_count or 0, caps["quotes"]),
-        _norm(reply_count or 0, caps["replies"]),
-        _norm(author_followers or 0, caps["followers"]),
-        # _norm(account_age_days or 0, caps["account_age_days"]),  # Excluded for now
-    ]
-    return sum(comps) / len(comps)
+    # Same arithmetic as _norm() per component, inlined to skip two calls each
+    total = 0.0
+    # account_age_days is excluded for now
+    for value, cap in zip(
+        (like_count, retweet_count, quote_count, reply_count, author_followers),
+        _cap_values(caps),
+    ):
+        x = (value or 0) / cap
+        x = x if x < 1.0 else 1.0
+        total += x if x > 0.0 else 0.0
+    return total / 5
 
 
 # ===== Validator Batch Verification =====
 
+class _Resolved:
+    """Future-like wrapper that runs fn(arg) lazily on result(), for analyzers without a pool"""
+    __slots__ = ("_fn", "_arg")
+
+    def __init__(self, fn, arg):
+        self._fn = fn
+        self._arg = arg
+
+    def result(self):
+        return self._fn(self._arg)
+
+    def cancel(self) -> bool:
+        return False
+
+
 def validate_miner_batch(
     miner_batch: List[Dict],
     analyzer: SubnetRelevanceAnalyzer,
     sample_size: int = 10,
-    seed: int = None
+    seed: int = None,
+    fail_fast: bool = True,
 ) -> Tuple[bool, Dict]:
     """
     Validate a miner's batch by sampling posts and checking for exact classification matches
@@ -132,44 +189,38 @@ def validate_miner_batch(
         analyzer: SubnetRelevanceAnalyzer instance
         sample_size: Number of posts to sample for validation (default: 10)
         seed: Random seed for reproducible sampling (optional)
+        fail_fast: Stop at the first discrepancy, since one is enough to reject the
+            batch (default: True). Pass False to classify the whole sample and
+            collect every discrepancy.
+    
+    Sampled posts are classified concurrently on the analyzer's shared post pool
+    (analyzers without one classify inline); results are compared in sample order.
         
     Returns:
         Tuple of (is_valid, result_dict):
             - is_valid: True if all sampled posts match exactly, False otherwise
             - result_dict: Contains 'matches', 'total_sampled', 'discrepancies'
+              (with fail_fast, 'total_sampled' counts only the posts checked)
     """
     
-    # Sample posts
-    if seed is not None:
-        random.seed(seed)
-    
+    # Sample post indices (a seeded private RNG picks the same posts random.seed() did,
+    # without reseeding the global generator)
+    rng = random.Random(seed) if seed is not None else random
     sample_size = min(sample_size, len(miner_batch))
-    sampled_posts = random.sample(miner_batch, sample_size)
+    sampled_posts = [miner_batch[j] for j in rng.sample(range(len(miner_batch)), sample_size)]
     
     bt.logging.info(f"[Validator] Sampling {sample_size} posts from batch of {len(miner_batch)}")
     
     matches = 0
+    checked = 0
     discrepancies = []
     
+    # Build miners' canonical strings first: a malformed claim needs no LLM call
+    claims = []
     for i, post_data in enumerate(sampled_posts):
         post_text = post_data.get("post_text", "")
-        miner_classification = post_data.get("miner_classification", {})
-        
-        # Validator runs classification
-        validator_result = analyzer.classify_post(post_text)
-        
-        if validator_result is None:
-            bt.logging.warning(f"[Validator] Failed to classify sampled post {i+1}")
-            discrepancies.append({
-                "post_index": i,
-                "reason": "validator_classification_failed",
-                "post_preview": post_text[:100]
-            })
-            continue
-        
-        # Build miner's canonical string from their claimed classification
         try:
-            miner_canonical = _build_canonical_from_dict(miner_classification)
+            claims.append((i, post_text, _build_canonical_from_dict(post_data.get("miner_classification", {}))))
         except Exception as e:
             bt.logging.warning(f"[Validator] Invalid miner classification format: {e}")
             discrepancies.append({
@@ -177,41 +228,73 @@ def validate_miner_batch(
                 "reason": "invalid_miner_format",
                 "error": str(e)
             })
-            continue
-        
-        # Get validator's canonical string
-        validator_canonical = validator_result.to_canonical_string()
-        
-        # Exact match check
-        if miner_canonical == validator_canonical:
-            matches += 1
-            bt.logging.debug(f"[Validator] Post {i+1}: MATCH")
+            if fail_fast:
+                checked = i + 1
+                claims = []
+                break
+    else:
+        checked = sample_size
+    
+    # Validator classifies the remaining posts concurrently, comparing in order
+    if claims:
+        submit = getattr(analyzer, "submit_classification", None)
+        if submit is not None:
+            futures = [submit(post_text) for _, post_text, _ in claims]
         else:
-            bt.logging.warning(f"[Validator] Post {i+1}: MISMATCH")
-            bt.logging.debug(f"  Miner:     {miner_canonical}")
-            bt.logging.debug(f"  Validator: {validator_canonical}")
-            discrepancies.append({
-                "post_index": i,
-                "reason": "canonical_mismatch",
-                "miner_canonical": miner_canonical,
-                "validator_canonical": validator_canonical,
-                "post_preview": post_text[:100]
-            })
+            futures = [_Resolved(analyzer.classify_post, post_text) for _, post_text, _ in claims]
+        try:
+            for (i, post_text, miner_canonical), future in zip(claims, futures):
+                validator_result = future.result()
+                
+                if validator_result is None:
+                    bt.logging.warning(f"[Validator] Failed to classify sampled post {i+1}")
+                    discrepancies.append({
+                        "post_index": i,
+                        "reason": "validator_classification_failed",
+                        "post_preview": post_text[:100]
+                    })
+                else:
+                    # Get validator's canonical string
+                    validator_canonical = validator_result.to_canonical_string()
+                    
+                    # Exact match check
+                    if miner_canonical == validator_canonical:
+                        matches += 1
+                        bt.logging.debug(f"[Validator] Post {i+1}: MATCH")
+                    else:
+                        bt.logging.warning(f"[Validator] Post {i+1}: MISMATCH")
+                        bt.logging.debug(f"  Miner:     {miner_canonical}")
+                        bt.logging.debug(f"  Validator: {validator_canonical}")
+                        discrepancies.append({
+                            "post_index": i,
+                            "reason": "canonical_mismatch",
+                            "miner_canonical": miner_canonical,
+                            "validator_canonical": validator_canonical,
+                            "post_preview": post_text[:100]
+                        })
+                
+                if fail_fast and discrepancies:
+                    checked = i + 1
+                    break
+        finally:
+            # Drop classifications that haven't started; in-flight ones finish in the background
+            for future in futures:
+                future.cancel()
     
     is_valid = (matches == sample_size) and (len(discrepancies) == 0)
     
     result = {
         "is_valid": is_valid,
         "matches": matches,
-        "total_sampled": sample_size,
+        "total_sampled": checked,
         "discrepancies": discrepancies,
-        "match_rate": matches / sample_size if sample_size > 0 else 0.0
+        "match_rate": matches / checked if checked > 0 else 0.0
     }
     
     if is_valid:
-        bt.logging.success(f"[Validator] Batch ACCEPTED: {matches}/{sample_size} matches")
+        bt.logging.success(f"[Validator] Batch ACCEPTED: {matches}/{checked} matches")
     else:
-        bt.logging.warning(f"[Validator] Batch REJECTED: {matches}/{sample_size} matches, {len(discrepancies)} discrepancies")
+        bt.logging.warning(f"[Validator] Batch REJECTED: {matches}/{checked} matches, {len(discrepancies)} discrepancies")
     
     return is_valid, result
 
@@ -228,22 +311,19 @@ def _build_canonical_from_dict(classification: Dict) -> str:
     Returns:
         Canonical string for exact matching
     """
-    # Extract fields
-    subnet_id = int(classification["subnet_id"])
-    content_type = classification["content_type"]
-    sentiment = classification["sentiment"]
-    technical_quality = classification["technical_quality"]
-    market_analysis = classification["market_analysis"]
-    impact_potential = classification["impact_potential"]
-    relevance_confidence = classification["relevance_confidence"]
-    evidence_spans = classification.get("evidence_spans", [])
-    anchors_detected = classification.get("anchors_detected", [])
-    
-    # Sort evidence for determinism (same as PostClassification)
-    sorted_evidence = "|".join(sorted([s.lower() for s in evidence_spans]))
-    sorted_anchors = "|".join(sorted([s.lower() for s in anchors_detected]))
-    
-    return f"{subnet_id}|{content_type}|{sentiment}|{technical_quality}|{market_analysis}|{impact_potential}|{relevance_confidence}|{sorted_evidence}|{sorted_anchors}"
+    # Field order matches PostClassification.to_canonical_string(); evidence and
+    # anchors are lowercased and sorted for determinism
+    return "|".join((
+        str(int(classification["subnet_id"])),
+        str(classification["content_type"]),
+        str(classification["sentiment"]),
+        str(classification["technical_quality"]),
+        str(classification["market_analysis"]),
+        str(classification["impact_potential"]),
+        str(classification["relevance_confidence"]),
+        "|".join(sorted(s.lower() for s in classification.get("evidence_spans", []))),
+        "|".join(sorted(s.lower() for s in classification.get("anchors_detected", []))),
+    ))
 
 
 # ===== Scoring Weights =====
@@ -257,7 +337,8 @@ RECENCY_WEIGHT = 0.10    # 10% weight on recency
 def compute_post_score(
     classification: PostClassification,
     post_info: Dict,
-    weights: Dict = None
+    weights: Dict = None,
+    now: datetime = None
 ) -> float:
     """
     Compute final post score combining classification + engagement + recency
@@ -266,14 +347,17 @@ def compute_post_score(
         classification: PostClassification result
         post_info: Dict with engagement metrics and post_date
         weights: Optional custom weights dict
+        now: Reference time (aware UTC), captured once if not given
         
     Returns:
         Final score in [0.0, 1.0]
     """
+    if now is None:
+        now = datetime.now(timezone.utc)
+    
     # Check if post is older than 10 days - if so, return 0
-    post_date_str = post_info.get("post_date", datetime.now(timezone.utc).isoformat())
-    dt = datetime.fromisoformat(post_date_str.replace("Z", "+00:00")).astimezone(timezone.utc)
-    age_days = (datetime.now(timezone.utc) - dt).total_seconds() / (3600.0 * 24.0)
+    post_date_str = post_info.get("post_date", now.isoformat())
+    age_days = (now - _parse_post_date(post_date_str)).total_seconds() / (3600.0 * 24.0)
     if age_days > 10:
         return 0.0
     
@@ -298,7 +382,7 @@ def compute_post_score(
     )
     
     # Recency
-    rec = recency_score(post_info.get("post_date", datetime.now(timezone.utc).isoformat()))
+    rec = recency_score(post_date_str, now=now)
     
     # Combine
     final = weights["relevance"] * relevance + weights["value"] * val + weights["recency"] * rec
@@ -360,7 +444,7 @@ def top_k_relevance_from_analyzer(text: str, analyzer, k: int = 5, analysis_resu
     return 1.0, [(subnet_name, classification_data)]  # Binary: matched or not
 
 
-def score_post_entry(entry: Dict, analyzer, k: int = 5, analysis_result: Dict = None) -> Dict:
+def score_post_entry(entry: Dict, analyzer, k: int = 5, analysis_result: Dict = None, now: datetime = None) -> Dict:
     """
     Score a single post entry with rich classification data preserved.
     
@@ -382,6 +466,7 @@ def score_post_entry(entry: Dict, analyzer, k: int = 5, analysis_result: Dict =
         analyzer: SubnetRelevanceAnalyzer instance
         k: Kept for API compatibility (not used anymore - we return 1 subnet or none)
         analysis_result: Optional pre-computed analysis result dict
+        now: Reference time (aware UTC); pass one value when scoring a batch
         
     Returns:
         Dictionary containing:
@@ -394,11 +479,12 @@ def score_post_entry(entry: Dict, analyzer, k: int = 5, analysis_result: Dict =
             - score: Final weighted score [0.0, 1.0]
     """
     info = entry["post_info"]
+    if now is None:
+        now = datetime.now(timezone.utc)
 
     # Check if post is older than 10 days - if so, return 0 score
-    post_date_str = info.get("post_date", datetime.now(timezone.utc).isoformat())
-    dt = datetime.fromisoformat(post_date_str.replace("Z", "+00:00")).astimezone(timezone.utc)
-    age_days = (datetime.now(timezone.utc) - dt).total_seconds() / (3600.0 * 24.0)
+    post_date_str = info.get("post_date", now.isoformat())
+    age_days = (now - _parse_post_date(post_date_str)).total_seconds() / (3600.0 * 24.0)
     if age_days > 10:
         return {
             "url": entry.get("url", ""),
@@ -410,12 +496,10 @@ def score_post_entry(entry: Dict, analyzer, k: int = 5, analysis_result: Dict =
             "score": 0.0
         }
 
-    # Get classification with full rich data
-    rel, subnet_data = top_k_relevance_from_analyzer(info["post_text"], analyzer, k=k, analysis_result=analysis_result)
-    
-    # Get the full classification object if available
+    # Analyze once and reuse the result for relevance and the classification object
     if analysis_result is None:
         analysis_result = analyzer.analyze_post_complete(info["post_text"])
+    rel, subnet_data = top_k_relevance_from_analyzer(info["post_text"], analyzer, k=k, analysis_result=analysis_result)
     classification = analysis_result.get("classification")
     
     # Compute engagement scores
@@ -427,7 +511,7 @@ def score_post_entry(entry: Dict, analyzer, k: int = 5, analysis_result: Dict =
         author_followers=info.get("author_followers", 0) or 0,
         account_age_days=info.get("account_age_days", 0) or 0,
     )
-    rec = recency_score(info["post_date"])
+    rec = recency_score(info["post_date"], now=now)
 
     # Combine components using default weights
     final = RELEVANCE_WEIGHT * rel + VALUE_WEIGHT * val + RECENCY_WEIGHT * rec
@@ -53,6 +53,13 @@ except ImportError:
 MODEL = os.getenv("MODEL", "null")
 API_KEY = os.getenv("API_KEY", "null")
 LLM_BASE = os.getenv("LLM_BASE", "null")
+# One tool call per classification dimension (true) or a single combined call per post (false).
+# Miners and validators must use the same mode or their classifications may disagree.
+ANALYZER_ATOMIC_CLASSIFICATION = os.getenv("ANALYZER_ATOMIC_CLASSIFICATION", "true").lower() == "true"
+# Sentiment backend: "llm" (tool call) or "local" (on-device transformers model, needs
+# the optional transformers package). Miners and validators must use the same backend.
+SENTIMENT_BACKEND = os.getenv("SENTIMENT_BACKEND", "llm").lower()
+SENTIMENT_MODEL = os.getenv("SENTIMENT_MODEL", "cardiffnlp/twitter-roberta-base-sentiment-latest")
 
 # X/Twitter API Configuration
 X_BEARER_TOKEN = os.getenv("X_BEARER_TOKEN", "null")
@@ -86,6 +93,17 @@ POSTS_TO_SUBMIT = int(os.getenv("POSTS_TO_SUBMIT", "1"))  # Unused - all scraped
 MAX_SUBMISSIONS_PER_WINDOW = int(os.getenv("MAX_SUBMISSIONS_PER_WINDOW", os.getenv("MAX_SUBMISSION_RATE", "5")))
 # Blocks per window (default: 100 blocks, ~20 minutes at 12s per block)
 BLOCKS_PER_WINDOW = int(os.getenv("BLOCKS_PER_WINDOW", "100"))
+# Seconds a signed X-Auth header set is reused across submissions (0 = sign every request).
+# Must stay well inside the API's timestamp tolerance.
+MINER_AUTH_CACHE_SECONDS = float(os.getenv("MINER_AUTH_CACHE_SECONDS", "10"))
+# Submission retries: attempts per post, base backoff (doubles per attempt, jittered 0.5-1.5x)
+# and the cap on any single wait, in seconds
+MINER_SUBMIT_MAX_ATTEMPTS = int(os.getenv("MINER_SUBMIT_MAX_ATTEMPTS", "3"))
+MINER_SUBMIT_BACKOFF_BASE = float(os.getenv("MINER_SUBMIT_BACKOFF_BASE", "3.0"))
+MINER_SUBMIT_MAX_BACKOFF = float(os.getenv("MINER_SUBMIT_MAX_BACKOFF", "30.0"))
+# Wall-clock budget in seconds for re-submitting a window's failed posts; no new retry
+# round starts once its backoff would overrun this
+MINER_RETRY_DEADLINE_SECONDS = float(os.getenv("MINER_RETRY_DEADLINE_SECONDS", "120"))
 
 
 # ============================================================================
@@ -99,4 +117,18 @@ VOTE_ENDPOINT = os.getenv("VOTE_ENDPOINT", "null")
 # Backward compatibility: support both old and new names
 VALIDATION_POLL_SECONDS = int(os.getenv("VALIDATION_POLL_SECONDS", os.getenv("BATCH_POLL_SECONDS", "10")))
 SCORES_BLOCK_INTERVAL = int(os.getenv("SCORES_BLOCK_INTERVAL", "100"))
-
+# Upper bound on the validation poll interval; idle polls back off from
+# VALIDATION_POLL_SECONDS towards this (set equal to disable the backoff)
+VALIDATION_MAX_POLL_SECONDS = float(os.getenv("VALIDATION_MAX_POLL_SECONDS", "30"))
+# Validation result batching: flush to /v2/validation_result once this many results
+# are pending, or every VALIDATION_FLUSH_INTERVAL seconds, whichever comes first
+VALIDATION_RESULT_BATCH_SIZE = int(os.getenv("VALIDATION_RESULT_BATCH_SIZE", "32"))
+VALIDATION_FLUSH_INTERVAL = float(os.getenv("VALIDATION_FLUSH_INTERVAL", "2.0"))
+# Maximum number of posts graded concurrently by the validator
+VALIDATION_MAX_CONCURRENCY = int(os.getenv("VALIDATION_MAX_CONCURRENCY", "8"))
+# Maximum pending validation results kept for retry (oldest dropped beyond this)
+VALIDATION_MAX_PENDING_RESULTS = int(os.getenv("VALIDATION_MAX_PENDING_RESULTS", "10000"))
+# Attempts (with exponential backoff) per validation result submission
+VALIDATION_SUBMIT_RETRIES = int(os.getenv("VALIDATION_SUBMIT_RETRIES", "3"))
+# Seconds a signed X-Auth header set is reused across API calls (0 = sign every request)
+VALIDATION_AUTH_CACHE_SECONDS = float(os.getenv("VALIDATION_AUTH_CACHE_SECONDS", "10"))
@@ -3,14 +3,22 @@ API client for submitting posts to the API v2 server.
 
 This module handles HTTP communication with the subnet API server, including:
 - POST requests to the /v2/submit endpoint
-- Retry logic with exponential backoff (3s, 6s, 12s)
+- Retry logic with jittered, capped exponential backoff
 - Header authentication (X-Auth-* headers)
 - Response handling and status validation
 - Prominent logging of validation selection status
 """
 
+import random
+import threading
 import time
 import requests
+from requests.adapters import HTTPAdapter
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
 import bittensor as bt
 from typing import Dict, Optional
 
@@ -46,6 +54,41 @@ def sign_message(wallet, message):
     signature = wallet.hotkey.sign(message)
     return signature.hex()
 
+def _backoff_seconds(attempt: int, resp=None) -> float:
+    """
+    Wait before retry number attempt+1: capped exponential backoff with jitter.
+    
+    A numeric Retry-After header on the response takes precedence (still capped).
+    The 0.5-1.5x jitter keeps miners from retrying in lockstep after an API outage.
+    """
+    cap = config.MINER_SUBMIT_MAX_BACKOFF
+    retry_after = resp.headers.get("Retry-After") if resp is not None else None
+    if retry_after:
+        try:
+            return min(cap, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    return min(cap, config.MINER_SUBMIT_BACKOFF_BASE * (2 ** attempt)) * (0.5 + random.random())
+
+def _dumps(payload: Dict) -> bytes:
+    """Serialize a request body to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+def _json_body(resp) -> Dict:
+    """
+    Decode an error response body once; {} if it isn't a JSON object.
+    
+    Decode failures are logged instead of silently swallowed.
+    """
+    try:
+        data = resp.json()
+    except ValueError as e:
+        bt.logging.debug(f"[APIClient] Non-JSON response body ({resp.status_code}): {e}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
 class APIClient:
     """
     Client for submitting analyzed posts to the subnet API server.
@@ -69,15 +112,33 @@ class APIClient:
         self.submission_count = 0
         self.base_url = config.MINER_API_URL
         self.wallet = wallet
+        # One pooled session so repeated submissions reuse TCP/TLS connections
+        # instead of handshaking on every post (retries are handled below)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # Static headers live on the session; requests only merges in the auth headers
+        self._session.headers.update({
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        })
+        # Signed auth headers are reused for MINER_AUTH_CACHE_SECONDS (0 = sign every request)
+        self._auth_cache: tuple = (None, {})
+        self._auth_lock = threading.Lock()
+
+    def close(self):
+        """Close the pooled HTTP session."""
+        self._session.close()
 
     def _submit_to_api(self, post_data: Dict) -> tuple[bool, Optional[Dict], Optional[int]]:
         """
         Internal method to submit a post to the API server (v2).
         
-        Implements retry logic with exponential backoff:
-        - Up to 3 attempts total (initial + 2 retries)
-        - Wait times between retries: 3s after first failure, 6s after second failure
-        - Wait time calculated as: 3 * (2^attempt) seconds
+        Implements retry logic with jittered exponential backoff:
+        - Up to MINER_SUBMIT_MAX_ATTEMPTS attempts total (default 3)
+        - Wait time: min(MINER_SUBMIT_MAX_BACKOFF, MINER_SUBMIT_BACKOFF_BASE * 2^attempt),
+          scaled by a random 0.5-1.5x factor (Retry-After is honored when present)
         - 10 second timeout per request
         - Handles 429 rate limit errors with longer backoff
         - Does NOT retry on 409 (Conflict) errors - these are permanent failures
@@ -100,34 +161,27 @@ class APIClient:
         hotkey = post_data.get("miner_hotkey", "")
         
         # Create authentication headers if wallet is available
-        headers = {}
-        if self.wallet:
-            try:
-                timestamp = time.time()
-                message = create_auth_message(timestamp)
-                signature = sign_message(self.wallet, message)
-                headers = {
-                    "X-Auth-SS58Address": self.wallet.hotkey.ss58_address,
-                    "X-Auth-Signature": signature,
-                    "X-Auth-Message": message,
-                    "X-Auth-Timestamp": str(timestamp)
-                }
-                bt.logging.debug(f"[APIClient] Added authentication headers for hotkey: {hotkey}")
-            except Exception as e:
-                bt.logging.warning(f"[APIClient] Failed to create auth headers: {e}, proceeding without auth")
-                headers = {}
+        headers = self._auth_headers()
+        if headers:
+            bt.logging.debug(f"[APIClient] Added authentication headers for hotkey: {hotkey}")
         
         bt.logging.info(f"[APIClient] Submitting post {post_id} to {url} (hotkey: {hotkey})")
         
-        # Retry logic: up to 3 attempts with exponential backoff
-        # Wait time = 3 * (2^attempt) seconds (gives 3s, 6s, 12s)
+        # Encode the body once; every retry sends the same bytes
+        try:
+            body = _dumps(post_data)
+        except TypeError as e:
+            bt.logging.error(f"[APIClient] Post {post_id} is not JSON-serializable: {e}")
+            return False, None, None
+        
+        # Retry logic: jittered, capped exponential backoff (see _backoff_seconds)
         # For rate limits (429), we return immediately without retrying
         # (caller should wait for the next window)
-        max_attempts = 3
+        max_attempts = config.MINER_SUBMIT_MAX_ATTEMPTS
         for attempt in range(max_attempts):
             try:
                 bt.logging.debug(f"[APIClient] Attempt {attempt+1}/{max_attempts} for post {post_id}")
-                resp = requests.post(url, json=post_data, headers=headers, timeout=10)
+                resp = self._session.post(url, data=body, headers=headers or None, timeout=10)
                 
                 # Handle rate limit (429) separately - API enforces rate limits server-side
                 # When rate limited, we return immediately so the caller can wait for the next window
@@ -137,24 +191,21 @@ class APIClient:
                     reset_block = None
                     reset_seconds = None
                     
-                    try:
-                        error_data = resp.json()
-                        # Handle both string and dict detail formats
-                        if isinstance(error_data.get("detail"), dict):
-                            detail_dict = error_data["detail"]
-                            error_detail = detail_dict.get("message", "Rate limit exceeded")
-                            rate_limit_info = detail_dict.get("rate_limit")
-                            if rate_limit_info:
-                                reset_block = rate_limit_info.get("next_window_start_block")
-                                reset_seconds = rate_limit_info.get("estimated_seconds_until_reset")
-                        elif isinstance(error_data.get("detail"), str):
-                            error_detail = error_data["detail"]
-                        
-                        # Also check headers for rate limit info
-                        reset_block = reset_block or resp.headers.get("X-RateLimit-Reset-Block")
-                        reset_seconds = reset_seconds or resp.headers.get("X-RateLimit-Reset-Seconds")
-                    except:
-                        pass
+                    error_data = _json_body(resp)
+                    # Handle both string and dict detail formats
+                    if isinstance(error_data.get("detail"), dict):
+                        detail_dict = error_data["detail"]
+                        error_detail = detail_dict.get("message", "Rate limit exceeded")
+                        rate_limit_info = detail_dict.get("rate_limit")
+                        if rate_limit_info:
+                            reset_block = rate_limit_info.get("next_window_start_block")
+                            reset_seconds = rate_limit_info.get("estimated_seconds_until_reset")
+                    elif isinstance(error_data.get("detail"), str):
+                        error_detail = error_data["detail"]
+                    
+                    # Also check headers for rate limit info
+                    reset_block = reset_block or resp.headers.get("X-RateLimit-Reset-Block")
+                    reset_seconds = reset_seconds or resp.headers.get("X-RateLimit-Reset-Seconds")
                     
                     # Build informative log message
                     log_msg = f"[APIClient] ⚠️  Rate limit exceeded (429) for {post_id}: {error_detail}"
@@ -186,62 +237,45 @@ class APIClient:
                 # Handle 409 Conflict errors - these are permanent failures (duplicate/conflict)
                 # Don't retry these as they indicate the post was already submitted or conflicts exist
                 if resp.status_code == 409:
-                    try:
-                        error_data = resp.json()
-                        error_detail = error_data.get("detail", "Conflict")
-                        if isinstance(error_detail, dict):
-                            error_detail = error_detail.get("message", "Conflict")
-                    except:
-                        error_detail = "Conflict"
+                    # Parse the body once for both the detail and the block info
+                    error_data = _json_body(resp)
+                    error_detail = error_data.get("detail", "Conflict")
+                    if isinstance(error_detail, dict):
+                        error_detail = error_detail.get("message", "Conflict")
                     
                     bt.logging.warning(f"[APIClient] ✗ Conflict (409) for {post_id}: {error_detail}. Not retrying.")
                     # Extract block info if available (even on error, API may return it for synchronization)
-                    block_info = None
-                    try:
-                        error_data = resp.json()
-                        block_info = {
-                            "current_block": error_data.get("current_block"),
-                            "window_start_block": error_data.get("window_start_block"),
-                            "window_end_block": error_data.get("window_end_block"),
-                            "next_window_start_block": error_data.get("next_window_start_block"),
-                            "blocks_per_window": error_data.get("blocks_per_window"),
-                        }
-                    except:
-                        pass
+                    block_info = {
+                        "current_block": error_data.get("current_block"),
+                        "window_start_block": error_data.get("window_start_block"),
+                        "window_end_block": error_data.get("window_end_block"),
+                        "next_window_start_block": error_data.get("next_window_start_block"),
+                        "blocks_per_window": error_data.get("blocks_per_window"),
+                    } if error_data else None
                     return False, block_info, 409
                 
                 # Handle validation errors (422) - these indicate the request data is invalid
                 if resp.status_code == 422:
                     error_detail = "Validation error"
                     validation_errors = []
-                    try:
-                        error_data = resp.json()
-                        # Handle both string and dict detail formats
-                        if isinstance(error_data.get("detail"), list):
-                            # List of validation errors
-                            validation_errors = error_data["detail"]
-                            error_messages = []
-                            for err in validation_errors:
-                                field = err.get("field", "unknown")
-                                msg = err.get("message", "validation error")
-                                error_messages.append(f"{field}: {msg}")
-                            error_detail = "; ".join(error_messages)
-                        elif isinstance(error_data.get("detail"), dict):
-                            detail_dict = error_data["detail"]
-                            if isinstance(detail_dict.get("detail"), list):
-                                validation_errors = detail_dict["detail"]
-                                error_messages = []
-                                for err in validation_errors:
-                                    field = err.get("field", "unknown")
-                                    msg = err.get("message", "validation error")
-                                    error_messages.append(f"{field}: {msg}")
-                                error_detail = "; ".join(error_messages)
-                            else:
-                                error_detail = detail_dict.get("message", "Validation error - check field details")
-                        elif isinstance(error_data.get("detail"), str):
-                            error_detail = error_data["detail"]
-                    except:
-                        pass
+                    error_data = _json_body(resp)
+                    # Handle list, nested-dict and string detail formats
+                    detail = error_data.get("detail")
+                    if isinstance(detail, dict):
+                        if isinstance(detail.get("detail"), list):
+                            detail = detail["detail"]
+                        else:
+                            error_detail = detail.get("message", "Validation error - check field details")
+                    if isinstance(detail, list):
+                        # List of validation errors
+                        validation_errors = detail
+                        error_detail = "; ".join(
+                            f"{err.get('field', 'unknown')}: {err.get('message', 'validation error')}"
+                            for err in validation_errors
+                            if isinstance(err, dict)
+                        )
+                    elif isinstance(detail, str):
+                        error_detail = detail
                     
                     bt.logging.error(
                         f"[APIClient] ✗ Validation error (422) for {post_id}: {error_detail}"
@@ -318,8 +352,8 @@ class APIClient:
                 # Already handled 429 and 409 above, this is for other HTTP errors (500, 502, etc.)
                 bt.logging.warning(f"[APIClient] HTTP error on attempt {attempt+1}/{max_attempts} for {post_id}: {e}")
                 if attempt < max_attempts - 1:
-                    wait_time = 3 * (2 ** attempt)
-                    bt.logging.debug(f"[APIClient] Retrying in {wait_time}s...")
+                    wait_time = _backoff_seconds(attempt, e.response)
+                    bt.logging.debug(f"[APIClient] Retrying in {wait_time:.1f}s...")
                     time.sleep(wait_time)
                 else:
                     # Last attempt failed, return error status
@@ -329,12 +363,43 @@ class APIClient:
                 # Network errors, timeouts, etc. - retry with exponential backoff
                 bt.logging.warning(f"[APIClient] Submit attempt {attempt+1}/{max_attempts} for {post_id} failed: {e}")
                 if attempt < max_attempts - 1:
-                    wait_time = 3 * (2 ** attempt)
-                    bt.logging.debug(f"[APIClient] Retrying in {wait_time}s...")
+                    wait_time = _backoff_seconds(attempt)
+                    bt.logging.debug(f"[APIClient] Retrying in {wait_time:.1f}s...")
                     time.sleep(wait_time)
         bt.logging.error(f"[APIClient] All {max_attempts} attempts failed for post {post_id}")
         return False, None, None
 
+    def _auth_headers(self) -> Dict[str, str]:
+        """
+        Signed X-Auth-* headers, or {} without a wallet or if signing fails.
+        
+        Signing is the heaviest CPU step per submission, so one signature is reused
+        for a MINER_AUTH_CACHE_SECONDS bucket. Keep that well inside the server's
+        timestamp tolerance.
+        """
+        if not self.wallet:
+            return {}
+        ttl = config.MINER_AUTH_CACHE_SECONDS
+        with self._auth_lock:
+            timestamp = time.time()
+            bucket = int(timestamp // ttl) if ttl > 0 else None
+            if bucket is not None and self._auth_cache[0] == bucket:
+                return self._auth_cache[1]
+            try:
+                message = create_auth_message(timestamp)
+                signature = sign_message(self.wallet, message)
+                headers = {
+                    "X-Auth-SS58Address": self.wallet.hotkey.ss58_address,
+                    "X-Auth-Signature": signature,
+                    "X-Auth-Message": message,
+                    "X-Auth-Timestamp": str(timestamp)
+                }
+            except Exception as e:
+                bt.logging.warning(f"[APIClient] Failed to create auth headers: {e}, proceeding without auth")
+                return {}
+            self._auth_cache = (bucket, headers)
+            return headers
+
     def get_status(self) -> Optional[Dict]:
         """
         Query the API /v2/status endpoint to get current block and window information.
@@ -356,7 +421,7 @@ class APIClient:
         """
         url = f"{self.base_url}/v2/status"
         try:
-            resp = requests.get(url, timeout=10)
+            resp = self._session.get(url, timeout=10)
             resp.raise_for_status()
             data = resp.json()
             if data.get("status") == "ok":
@@ -402,6 +467,11 @@ class APIClient:
         """
         self.submission_count += 1
         success, block_info, error_status = self._submit_to_api(post_data)
+        self._log_result(post_data, success, error_status)
+        return success, block_info, error_status
+
+    @staticmethod
+    def _log_result(post_data: Dict, success: bool, error_status: Optional[int]):
         if success:
             bt.logging.trace(f"[APIClient] Submitted post '{post_data.get('post_id')}' successfully")
         else:
@@ -409,4 +479,3 @@ class APIClient:
             if error_status:
                 error_msg += f" (HTTP {error_status})"
             bt.logging.warning(error_msg)
-        return success, block_info, error_status
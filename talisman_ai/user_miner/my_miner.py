@@ -13,6 +13,7 @@ desynchronization issues.
 
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import bittensor as bt
 from typing import Dict, Optional
 from datetime import datetime, timezone
@@ -20,10 +21,42 @@ from datetime import datetime, timezone
 from talisman_ai import config
 from talisman_ai.user_miner.api_client import APIClient
 from talisman_ai.user_miner.post_scraper import PostScraper
-from talisman_ai.analyzer import setup_analyzer
+from talisman_ai.analyzer import get_analyzer
 from talisman_ai.analyzer.scoring import score_post_entry
 from talisman_ai.utils.normalization import norm_text
 
+def _int_field(post: Dict, key: str) -> int:
+    """Integer post field, treating missing/None/0 as 0"""
+    return int(post.get(key, 0) or 0)
+
+
+# Upper bound on remembered submitted post IDs; the oldest are forgotten first
+MAX_SEEN_POST_IDS = 100_000
+
+
+class _SeenPostIds:
+    """Insertion-ordered set of post IDs that evicts the oldest beyond maxsize"""
+
+    __slots__ = ("_ids", "_maxsize")
+
+    def __init__(self, maxsize: int):
+        self._ids: Dict[str, None] = {}
+        self._maxsize = maxsize
+
+    def __contains__(self, pid: str) -> bool:
+        return pid in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, pid: str):
+        if pid in self._ids:
+            return
+        self._ids[pid] = None
+        if len(self._ids) > self._maxsize:
+            del self._ids[next(iter(self._ids))]
+
+
 class MyMiner:
     """
     User miner that processes posts in a background thread.
@@ -51,19 +84,26 @@ class MyMiner:
             subtensor: Optional Bittensor subtensor for getting current block number.
         """
         self.scraper = PostScraper()
-        self.analyzer = setup_analyzer()
+        # The analyzer (subnet index, LLM client) is built on first use in the background
+        # thread, so constructing and starting the miner doesn't block on it
+        self._analyzer = None
         self.api_client = APIClient(wallet=wallet)
+        # Submission worker, created in start() (see there)
+        self._submit_executor: ThreadPoolExecutor | None = None
 
         self.miner_hotkey = hotkey
         self.subtensor = subtensor
 
         # Track post IDs we've already processed to avoid duplicate submissions
-        self._seen_post_ids: set[str] = set()
+        # (bounded, so a long-running miner doesn't grow this without limit)
+        self._seen_post_ids = _SeenPostIds(MAX_SEEN_POST_IDS)
 
         # Threading state management
         self.lock = threading.Lock()
         self.running = False
         self.thread: threading.Thread | None = None
+        # Set by stop(); the loop waits on it instead of sleeping so shutdown is immediate
+        self._stop_event = threading.Event()
 
         # Post processing statistics
         self.posts_processed = 0
@@ -89,6 +129,13 @@ class MyMiner:
         # We rely on the API's response rather than tracking limits locally to avoid
         # desynchronization issues between client and server.
     
+    @property
+    def analyzer(self):
+        """Shared analyzer instance, created on first access"""
+        if self._analyzer is None:
+            self._analyzer = get_analyzer()
+        return self._analyzer
+    
     def _get_current_block(self) -> int:
         """
         Get the current block number.
@@ -205,7 +252,7 @@ class MyMiner:
         This ensures the miner's block number stays aligned with the server's view,
         which is important for accurate window calculations and rate limiting.
         """
-        now = time.time()
+        now = time.monotonic()
         
         # Check if enough time has passed since last status check
         if self._last_status_check is not None:
@@ -237,7 +284,12 @@ class MyMiner:
             # Attempt to synchronize with API before starting
             self._sync_with_api_on_startup()
             
+            # Submissions run on one background worker so the next post is analyzed while
+            # the previous one is in flight; a single worker keeps them in order for rate limiting
+            self._submit_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="miner-submit")
+            
             self.running = True
+            self._stop_event.clear()
             self.thread = threading.Thread(target=self._run, daemon=True)
             self.thread.start()
             bt.logging.info("[MyMiner] Started in background thread")
@@ -249,8 +301,11 @@ class MyMiner:
         """
         if self.running:
             self.running = False
+            self._stop_event.set()
             if self.thread:
                 self.thread.join(timeout=5)
+            self._submit_executor.shutdown(wait=False)
+            self.api_client.close()
             bt.logging.info("[MyMiner] Stopped")
     
 
@@ -281,7 +336,7 @@ class MyMiner:
                 
                 if current_block == 0:
                     bt.logging.warning("[MyMiner] Cannot get block number, waiting before retry...")
-                    time.sleep(poll_interval)
+                    self._stop_event.wait(poll_interval)
                     continue
                 
                 # Check if we should scrape (new block window)
@@ -298,7 +353,7 @@ class MyMiner:
                     if not posts:
                         bt.logging.warning("[MyMiner] No posts scraped, skipping this window")
                         self._last_block_window = current_window
-                        time.sleep(poll_interval)
+                        self._stop_event.wait(poll_interval)
                         continue
                     
                     # Pre-filter by engagement metrics (before analysis to save LLM costs)
@@ -348,13 +403,15 @@ class MyMiner:
                     if len(new_posts) == 0:
                         bt.logging.info("[MyMiner] No new posts to process, skipping this window")
                         self._last_block_window = current_window
-                        time.sleep(poll_interval)
+                        self._stop_event.wait(poll_interval)
                         continue
                     
                     # Process and submit all new posts
                     submitted_this_window = 0
                     failed_posts = []  # Track failed posts for retry logic
+                    pending = []  # (pid, post_data, future) for in-flight submissions, in order
                     
+                    prepared = []  # (post, pid, raw_content, content) ready for analysis
                     for post in new_posts:
                         pid = str(post.get("id", "unknown"))
                         bt.logging.debug(f"[MyMiner] Processing post ID: {pid}")
@@ -371,12 +428,16 @@ class MyMiner:
                         if not content:
                             bt.logging.warning(f"[MyMiner] Post {pid} content is empty after normalization, skipping")
                             continue
+                        prepared.append((post, pid, raw_content, content))
 
-                        # Analyze post content for subnet relevance and sentiment
-                        # This determines which subnets the post is relevant to and its overall sentiment
-                        bt.logging.debug(f"[MyMiner] Analyzing post {pid} (content length: {len(content)} chars)")
-                        analysis = self.analyzer.analyze_post_complete(content)
-                        bt.logging.debug(f"[MyMiner] Analysis complete for {pid}")
+                    # Analyze post content for subnet relevance and sentiment
+                    # All of the window's posts are analyzed concurrently; results are identical
+                    # to analyzing them one at a time
+                    bt.logging.debug(f"[MyMiner] Analyzing {len(prepared)} post(s)")
+                    analyses = self.analyzer.analyze_posts_each([p[3] for p in prepared])
+                    
+                    for (post, pid, raw_content, content), analysis in zip(prepared, analyses):
+                        bt.logging.debug(f"[MyMiner] Analysis complete for {pid} (content length: {len(content)} chars)")
                         
                         # Extract subnet relevance scores (range: 0.0 to 1.0) for each subnet
                         # Higher scores indicate greater relevance to that subnet
@@ -400,22 +461,29 @@ class MyMiner:
                         # This ensures consistency in how posts are evaluated
                         post_date = post.get("timestamp", 0)
                         if isinstance(post_date, int):
-                            dt = datetime.fromtimestamp(post_date, tz=timezone.utc)
-                            post_date_iso = dt.isoformat()
+                            # Same string as datetime.fromtimestamp(post_date, tz=timezone.utc).isoformat()
+                            post_date_iso = time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(post_date))
                         else:
                             post_date_iso = datetime.now(timezone.utc).isoformat()
                         
+                        # Engagement fields are read once and shared by the score entry and the submission
+                        likes = _int_field(post, "likes")
+                        retweets = _int_field(post, "retweets")
+                        responses = _int_field(post, "responses")
+                        followers = _int_field(post, "followers")
+                        account_age = int(post.get("account_age", 0))
+                        
                         post_entry = {
                             "url": f"post_{pid}",
                             "post_info": {
                                 "post_text": content,
                                 "post_date": post_date_iso,
-                                "like_count": int(post.get("likes", 0) or 0),
-                                "retweet_count": int(post.get("retweets", 0) or 0),
+                                "like_count": likes,
+                                "retweet_count": retweets,
                                 "quote_count": 0,
-                                "reply_count": int(post.get("responses", 0) or 0),
-                                "author_followers": int(post.get("followers", 0) or 0),
-                                "account_age_days": int(post.get("account_age", 0)),
+                                "reply_count": responses,
+                                "author_followers": followers,
+                                "account_age_days": account_age,
                             }
                         }
                         
@@ -433,20 +501,24 @@ class MyMiner:
                             "content": raw_content,  # Send raw content - API will normalize it
                             "date": int(post.get("timestamp", 0)),
                             "author": str(post.get("author", "unknown")),
-                            "account_age": int(post.get("account_age", 0)),
-                            "retweets": int(post.get("retweets", 0) or 0),
-                            "likes": int(post.get("likes", 0) or 0),
-                            "responses": int(post.get("responses", 0) or 0),
-                            "followers": int(post.get("followers", 0) or 0),
+                            "account_age": account_age,
+                            "retweets": retweets,
+                            "likes": likes,
+                            "responses": responses,
+                            "followers": followers,
                             "tokens": tokens,
                             "sentiment": sentiment,
                             "score": post_score,
                         }
                         bt.logging.debug(f"[MyMiner] Prepared post_data for {pid}: author={post_data['author']}, score={post_score:.3f}")
 
-                        # Submit post to API server
+                        # Submit post to API server in the background and move on to the next post
                         bt.logging.debug(f"[MyMiner] Submitting post {pid} to API...")
-                        success, block_info, error_status = self.api_client.submit_post(post_data)
+                        pending.append((pid, post_data, self._submit_executor.submit(self.api_client.submit_post, post_data)))
+                    
+                    # Collect submission results in submission order
+                    for pid, post_data, future in pending:
+                        success, block_info, error_status = future.result()
                         
                         # Synchronize with API's block number (source of truth for rate limiting)
                         # This ensures our window calculations stay aligned with the server
@@ -486,16 +558,14 @@ class MyMiner:
                     if failed_posts:
                         max_retries = 5  # Increased from 3 for better reliability
                         retry_delay = 1.0  # Reduced initial delay from 2.0s for faster retries
+                        retry_deadline = time.monotonic() + config.MINER_RETRY_DEADLINE_SECONDS
                         
                         for retry_attempt in range(max_retries):
                             if not failed_posts:
                                 break
                             
-                            bt.logging.info(f"[MyMiner] Retrying {len(failed_posts)} failed submission(s) (attempt {retry_attempt + 1}/{max_retries})...")
-                            # Exponential backoff: wait 2s, 4s, 8s between retries
-                            time.sleep(retry_delay * (2 ** retry_attempt))
-                            
                             remaining_failed = []
+                            to_retry = []
                             for post_data, original_error_status in failed_posts:
                                 pid = post_data.get("post_id", "unknown")
                                 
@@ -511,9 +581,32 @@ class MyMiner:
                                     remaining_failed.append((post_data, original_error_status))
                                     continue
                                 
-                                # Retry submission for transient errors
-                                bt.logging.info(f"[MyMiner] Retrying submission for post {pid}...")
-                                success, block_info, error_status = self.api_client.submit_post(post_data)
+                                to_retry.append(post_data)
+                            
+                            # Only rate-limited posts left: they wait for the next window, so don't
+                            # sleep through the remaining backoff rounds
+                            if not to_retry:
+                                failed_posts = remaining_failed
+                                break
+                            
+                            # Exponential backoff: wait 1s, 2s, 4s, ... between retries,
+                            # within the pass's overall time budget
+                            delay = retry_delay * (2 ** retry_attempt)
+                            if time.monotonic() + delay > retry_deadline:
+                                bt.logging.warning(
+                                    f"[MyMiner] Retry budget ({config.MINER_RETRY_DEADLINE_SECONDS:.0f}s) exhausted, "
+                                    f"giving up on {len(to_retry)} post(s)"
+                                )
+                                failed_posts = [(pd, st) for pd, st in failed_posts if st != 409]
+                                break
+                            bt.logging.info(f"[MyMiner] Retrying {len(to_retry)} failed submission(s) (attempt {retry_attempt + 1}/{max_retries})...")
+                            if self._stop_event.wait(delay):
+                                break
+                            
+                            # Retry transient failures on the single submit worker, in order
+                            results = list(self._submit_executor.map(self.api_client.submit_post, to_retry))
+                            for post_data, (success, block_info, error_status) in zip(to_retry, results):
+                                pid = post_data.get("post_id", "unknown")
                                 
                                 # Synchronize with API's block number
                                 if block_info and block_info.get("current_block"):
@@ -569,11 +662,11 @@ class MyMiner:
                     bt.logging.debug(f"[MyMiner] Block {current_block}, window {current_window}. Next window in ~{blocks_until_next} blocks (~{estimated_seconds}s)")
                 
                 # Poll for block changes before next iteration
-                time.sleep(poll_interval)
+                self._stop_event.wait(poll_interval)
 
             except Exception as e:
                 bt.logging.error(f"[MyMiner] Error in loop: {e}")
-                time.sleep(poll_interval)
+                self._stop_event.wait(poll_interval)
 
         bt.logging.info(f"[MyMiner] Background thread stopped. Processed {self.posts_processed} posts")
 
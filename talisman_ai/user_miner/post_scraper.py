@@ -133,14 +133,16 @@ class PostScraper:
                 users = {user.id: user for user in response.includes["users"]}
             
             # Convert tweets to our internal format
+            # (account ages are measured against one reference time for the whole response)
             posts = []
+            now = datetime.now(timezone.utc)
             for tweet in response.data:
                 author = users.get(tweet.author_id) if tweet.author_id else None
                 
                 # Calculate account age in days from account creation date
                 account_age_days = 0
                 if author and author.created_at:
-                    delta = datetime.now(timezone.utc) - author.created_at
+                    delta = now - author.created_at
                     account_age_days = delta.days
                 
                 # Get engagement metrics from tweet and author
@@ -6,6 +6,16 @@ EVENTS_LEVEL_NUM = 38
 DEFAULT_LOG_BACKUP_COUNT = 10
 
 
+def is_enabled_for(level: int) -> bool:
+    """
+    Return True if bittensor's logger would emit a record at `level`.
+
+    Use to guard f-string log calls on hot paths, since f-strings are formatted
+    eagerly even when the record is later filtered out.
+    """
+    return logging.getLogger("bittensor").isEnabledFor(level)
+
+
 def setup_events_logger(full_path, events_retention_size):
     logging.addLevelName(EVENTS_LEVEL_NUM, "EVENT")
 
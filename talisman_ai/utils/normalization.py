@@ -9,6 +9,8 @@ comparing text content.
 import unicodedata
 import re
 
+_WS_RE = re.compile(r"\s+")
+
 
 def norm_text(s: str) -> str:
     """
@@ -37,10 +39,12 @@ def norm_text(s: str) -> str:
         >>> norm_text("Café\\t\\t\\nCafé")  # Different unicode encodings normalized
         'Café Café'
     """
-    s = unicodedata.normalize("NFC", s or "")
-    s = s.replace("\r\n", "\n").replace("\r", "\n")
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    s = s or ""
+    # Pure-ASCII text is already NFC; skip the per-codepoint Unicode pass
+    if not s.isascii():
+        s = unicodedata.normalize("NFC", s)
+    # \r and \n are both \s, so the collapse below also unifies line endings
+    return _WS_RE.sub(" ", s).strip()
 
 
 def norm_author(s: str) -> str:
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Dict, List, Tuple, Optional
 
 import bittensor as bt
-from talisman_ai.analyzer import setup_analyzer
+from talisman_ai.analyzer import get_analyzer
 from talisman_ai.utils.normalization import norm_text
 
 # =============================================================================
@@ -39,9 +39,9 @@ def _err(code: str, message: str, post_id=None, details=None, post_index: Option
     return CONSENSUS_INVALID, {"error": e, "final_score": 0.0}
 
 def make_analyzer():
-    """Create validator analyzer instance."""
+    """Get the process-wide validator analyzer instance."""
     try:
-        return setup_analyzer()
+        return get_analyzer()
     except Exception as e:
         bt.logging.error(f"[GRADER] Analyzer init failed: {e}")
         return None
@@ -74,6 +74,10 @@ def select_tokens(miner_raw: Dict, ref_raw: Dict, k: int = 128, eps: float = 0.0
     mt = {k: v for k, v in normalize_keys(miner_raw).items() if abs(v) >= eps}
     rt = {k: v for k, v in normalize_keys(ref_raw).items() if abs(v) >= eps}
     keep = set(rt.keys())
+    if len(keep) + len(mt) <= k:
+        # Everything fits under the cap: no need to rank miner extras
+        keep.update(mt)
+        return {key: mt.get(key, 0.0) for key in keep}, rt
     extras = sorted((set(mt) - keep), key=lambda x: (-abs(mt[x]), x))
     for x in extras:
         if len(keep) >= k:
@@ -96,7 +100,9 @@ def grade_hotkey(posts: List[Dict], analyzer=None) -> Tuple[int, Dict]:
     """
     Grade posts using LLM validation (tokens and sentiment).
     
-    X API validation is done server-side. Stops on first failure.
+    X API validation is done server-side. Cheap format checks run over all posts
+    first, then every post is analyzed in one batch and compared in order; the
+    first failure is returned.
     
     Returns:
         (CONSENSUS_VALID or CONSENSUS_INVALID, result_dict)
@@ -110,6 +116,8 @@ def grade_hotkey(posts: List[Dict], analyzer=None) -> Tuple[int, Dict]:
     except Exception as e:
         return _err("analyzer_unavailable", str(e))
 
+    # Cheap per-post checks first, so a malformed batch costs no analyzer calls
+    checked = []
     for i, post in enumerate(posts):
         post_id = post.get("post_id")
         if not post_id:
@@ -126,12 +134,37 @@ def grade_hotkey(posts: List[Dict], analyzer=None) -> Tuple[int, Dict]:
         miner_tokens_raw = post.get("tokens") or {}
         miner_sent = float(post.get("sentiment") or 0.0)
         
+        # Validator sentiment is in [-1, 1] and relevance in [0, 1], so claims beyond those
+        # bounds plus tolerance can never match: reject them before spending an LLM call
+        if miner_sent > 1.0 + SENTIMENT_TOLERANCE or miner_sent < -1.0 - SENTIMENT_TOLERANCE:
+            return _err("invalid_range", "sentiment outside [-1, 1]", post_id, {"miner": miner_sent}, i)
+        # Only the upper bound is checked: tokens_match_within skips pairs that are both below eps,
+        # so a negative claim against a missing or near-zero reference token still matches
+        over = {k: v for k, v in normalize_keys(miner_tokens_raw).items() if v > 1.0 + TOKEN_TOLERANCE}
+        if over:
+            return _err("invalid_range", "subnet relevance above 1.0", post_id, {"tokens": over}, i)
+        
+        checked.append((i, post_id, content, miner_tokens_raw, miner_sent))
+    
+    # Analyze every post in one call (same single-post prompts, run concurrently)
+    analyses = None
+    analyze_each = getattr(analyzer, "analyze_posts_each", None)
+    if analyze_each is not None:
         try:
-            analysis_result = analyzer.analyze_post_complete(content)
+            analyses = analyze_each([c[2] for c in checked])
         except Exception as e:
-            bt.logging.error(f"[GRADER] Analyzer error: {e}")
-            return _err("analyzer_error", f"Analyzer failed: {e}", post_id, {}, i)
-        
+            bt.logging.warning(f"[GRADER] Batch analysis failed, retrying posts one by one: {e}")
+    if analyses is None:
+        # Per-post analysis pins an analyzer failure to the post that caused it
+        analyses = []
+        for i, post_id, content, _, _ in checked:
+            try:
+                analyses.append(analyzer.analyze_post_complete(content))
+            except Exception as e:
+                bt.logging.error(f"[GRADER] Analyzer error: {e}")
+                return _err("analyzer_error", f"Analyzer failed: {e}", post_id, {}, i)
+    
+    for (i, post_id, content, miner_tokens_raw, miner_sent), analysis_result in zip(checked, analyses):
         ref_tokens_raw = (analysis_result.get("subnet_relevance") or {})
         ref_tokens_raw_normalized = {str(k).strip().lower(): float(v.get("relevance", 0.0)) for k, v in ref_tokens_raw.items()}
         ref_sent = float(analysis_result.get("sentiment", 0.0))
@@ -1,18 +1,81 @@
 # talisman_ai/validator/validation_client.py
 import asyncio
+from dataclasses import dataclass
 from typing import Any, Dict, List, Callable, Optional
 import httpx
 import bittensor as bt
+import random
 import time
 
 from talisman_ai import config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+@dataclass(frozen=True)
+class ValidationResultRecord:
+    """Single validation result as submitted to /v2/validation_result"""
+    __slots__ = ("validator_hotkey", "validation_id", "miner_hotkey", "success", "failure_reason")
+
+    validator_hotkey: str
+    validation_id: Any
+    miner_hotkey: Optional[str]
+    success: bool
+    failure_reason: Optional[Dict[str, Any]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "validator_hotkey": self.validator_hotkey,
+            "validation_id": self.validation_id,
+            "miner_hotkey": self.miner_hotkey,
+            "success": self.success,
+            "failure_reason": self.failure_reason,
+        }
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for the stdlib json module"""
+    if isinstance(obj, ValidationResultRecord):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(payload: Any) -> bytes:
+    """Serialize a JSON payload to bytes, using orjson when available"""
+    if orjson is not None:
+        # orjson serializes dataclasses (including slotted ones) natively
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, default=_json_default).encode("utf-8")
+
+
+def _loads(content: bytes) -> Any:
+    """Parse a JSON response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def create_http_client(timeout: float) -> httpx.AsyncClient:
+    """Create the pooled keep-alive HTTP/2 client used for all validation API requests"""
+    return httpx.AsyncClient(
+        timeout=timeout,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        http2=True,
+    )
+
+
+AUTH_MESSAGE_PREFIX = "talisman-ai-auth:"
+
 
 def create_auth_message(timestamp=None):
     """Create a standardized authentication message"""
     if timestamp is None:
         timestamp = time.time()
-    return f"talisman-ai-auth:{int(timestamp)}"
+    return AUTH_MESSAGE_PREFIX + str(int(timestamp))
 
 
 def sign_message(wallet, message):
@@ -38,6 +101,7 @@ class ValidationClient:
         http_timeout: Optional[float] = None,
         scores_block_interval: Optional[int] = None,
         wallet: Optional[bt.wallet] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize the ValidationClient.
@@ -48,36 +112,77 @@ class ValidationClient:
             http_timeout: HTTP request timeout in seconds. Defaults to BATCH_HTTP_TIMEOUT env var or 30.0 seconds
             scores_block_interval: Blocks between score fetches. Defaults to SCORES_BLOCK_INTERVAL env var or 100
             wallet: Optional Bittensor wallet for authentication
+            http_client: Optional shared httpx.AsyncClient (keep-alive pool) reused for all requests,
+                normally built with create_http_client(). If omitted, one is created lazily on
+                first use and owned by this client.
         """
         self.api_url = api_url or config.MINER_API_URL
         self.validation_endpoint = f"{self.api_url}/v2/validation"
         self.validation_result_endpoint = f"{self.api_url}/v2/validation_result"
         self.scores_endpoint = f"{self.api_url}/v2/scores"
+        self.status_endpoint = f"{self.api_url}/v2/status"
         self.poll_seconds = int(poll_seconds or config.VALIDATION_POLL_SECONDS)
         self.http_timeout = float(http_timeout or config.BATCH_HTTP_TIMEOUT)
         self.scores_block_interval = int(scores_block_interval or config.SCORES_BLOCK_INTERVAL)
         self.wallet = wallet
+        # The hotkey never changes at runtime; resolve its address once
+        self._hotkey_ss58: Optional[str] = str(wallet.hotkey.ss58_address) if wallet else None
+        self._client: Optional[httpx.AsyncClient] = http_client
+        # A client created here (not passed in) is ours to close when run() exits
+        self._owns_client: bool = http_client is None
 
         self._running: bool = False
         self._last_scores_window: Optional[int] = None  # Last window number we fetched scores for (from API)
         self._current_validations: List[Dict[str, Any]] = []
-        self._last_status_check: Optional[float] = None  # Timestamp of last status check
+        self._last_status_check: Optional[float] = None  # Monotonic time of last status check
         self._status_check_interval: int = 60  # Check status every 60 seconds (scores change every ~20 minutes)
+        self._auth_cache: tuple = (None, {})  # (time bucket, signed headers)
+        # Idle backoff: consecutive polls that found no work stretch the sleep up to
+        # max_poll_seconds (jittered so validators don't poll in lockstep)
+        self.max_poll_seconds = max(float(config.VALIDATION_MAX_POLL_SECONDS), self.poll_seconds)
+        self._idle_count: int = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the shared HTTP client, creating a pooled one on first use.
+
+        httpx advertises and transparently decodes gzip (and br when brotli is
+        installed), so the larger JSON bodies such as /v2/scores come back compressed.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = create_http_client(self.http_timeout)
+        return self._client
+
+    async def aclose(self):
+        """Close the underlying HTTP client and release pooled connections"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
 
     def _create_auth_headers(self) -> Dict[str, str]:
-        """Create authentication headers if wallet is available"""
+        """
+        Create authentication headers if wallet is available.
+
+        One signature is reused for a VALIDATION_AUTH_CACHE_SECONDS bucket; callers
+        get a fresh copy they are free to extend.
+        """
         headers = {}
         if self.wallet:
+            ttl = config.VALIDATION_AUTH_CACHE_SECONDS
+            timestamp = time.time()
+            bucket = int(timestamp // ttl) if ttl > 0 else None
+            if bucket is not None and self._auth_cache[0] == bucket:
+                return dict(self._auth_cache[1])
             try:
-                timestamp = time.time()
                 message = create_auth_message(timestamp)
                 signature = sign_message(self.wallet, message)
                 headers = {
-                    "X-Auth-SS58Address": self.wallet.hotkey.ss58_address,
+                    "X-Auth-SS58Address": self._hotkey_ss58,
                     "X-Auth-Signature": signature,
                     "X-Auth-Message": message,
                     "X-Auth-Timestamp": str(timestamp)
                 }
+                self._auth_cache = (bucket, headers)
+                headers = dict(headers)
             except Exception as e:
                 bt.logging.warning(f"[VALIDATION] Failed to create auth headers: {e}")
         return headers
@@ -85,60 +190,59 @@ class ValidationClient:
     async def fetch_validations(self) -> List[Dict[str, Any]]:
         """Fetch pending validation payloads from /v2/validation"""
         headers = self._create_auth_headers()
-        async with httpx.AsyncClient(timeout=self.http_timeout) as client:
-            r = await client.get(self.validation_endpoint, headers=headers)
-            r.raise_for_status()
-            data = r.json()
-            if data.get("available"):
-                return data.get("payloads", [])
-            return []
-
-    async def submit_results(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        r = await self._get_client().get(self.validation_endpoint, headers=headers)
+        r.raise_for_status()
+        data = _loads(r.content)
+        if data.get("available"):
+            return data.get("payloads", [])
+        return []
+
+    async def submit_results(self, results: List[ValidationResultRecord]) -> Dict[str, Any]:
         """Submit validation results to /v2/validation_result"""
         payload = {
-            "validator_hotkey": str(self.wallet.hotkey.ss58_address),
+            "validator_hotkey": self._hotkey_ss58,
             "results": results,
         }
         headers = self._create_auth_headers()
-        async with httpx.AsyncClient(timeout=self.http_timeout) as client:
-            r = await client.post(self.validation_result_endpoint, json=payload, headers=headers)
-            r.raise_for_status()
-            return r.json()
+        headers["Content-Type"] = "application/json"
+        r = await self._get_client().post(self.validation_result_endpoint, content=_dumps(payload), headers=headers)
+        r.raise_for_status()
+        return _loads(r.content)
 
     async def fetch_status(self) -> Optional[Dict[str, Any]]:
         """Fetch status from /v2/status to sync block numbers"""
-        status_endpoint = f"{self.api_url}/v2/status"
-        async with httpx.AsyncClient(timeout=self.http_timeout) as client:
-            r = await client.get(status_endpoint)
-            r.raise_for_status()
-            return r.json()
+        r = await self._get_client().get(self.status_endpoint)
+        r.raise_for_status()
+        return _loads(r.content)
 
     async def fetch_scores(self) -> Optional[Dict[str, Any]]:
         """Fetch scores from /v2/scores"""
         headers = self._create_auth_headers()
-        async with httpx.AsyncClient(timeout=self.http_timeout) as client:
-            r = await client.get(self.scores_endpoint, headers=headers)
-            r.raise_for_status()
-            return r.json()
+        r = await self._get_client().get(self.scores_endpoint, headers=headers)
+        r.raise_for_status()
+        return _loads(r.content)
 
-    async def _should_fetch_scores(self) -> bool:
+    async def _should_fetch_scores(self) -> Optional[Dict[str, Any]]:
         """
         Check if we should fetch scores by querying API's current window.
         
         Since the API now returns scores from the PREVIOUS window, we fetch scores
         when a new window starts (i.e., when current_window > last_scores_window).
         This ensures we get the completed previous window's scores.
+
+        Returns:
+            The /v2/status payload (with current_window set) when scores should be
+            fetched, otherwise None.
         """
-        import time
-        
         # Only check status periodically (not every loop iteration)
         # Since scores change every ~20 minutes, checking every 60 seconds is sufficient
-        now = time.time()
+        # Monotonic clock: wall-clock jumps (NTP, suspend) must not stall or burst the checks
+        now = time.monotonic()
         if self._last_status_check is not None:
             time_since_last_check = now - self._last_status_check
             if time_since_last_check < self._status_check_interval:
                 # Too soon to check again
-                return False
+                return None
         
         self._last_status_check = now
         
@@ -151,15 +255,21 @@ class ValidationClient:
                     # Fetch if we haven't fetched for this current window yet
                     # When a new window starts, we want to fetch the previous window's scores
                     if self._last_scores_window is None or self._last_scores_window < api_current_window:
-                        return True
+                        return status_data
                     
                     # Already fetched for this window
-                    return False
+                    return None
         except Exception as e:
             bt.logging.debug(f"[VALIDATION] Failed to check API window: {e}")
         
         # If we can't determine, don't fetch (will retry on next check interval)
-        return False
+        return None
+
+    def _idle_sleep_seconds(self) -> float:
+        """Sleep before the next poll: grows linearly with consecutive idle polls, jittered +/-20%"""
+        delay = min(self.poll_seconds * (1 + self._idle_count), self.max_poll_seconds)
+        self._idle_count += 1
+        return delay * random.uniform(0.8, 1.2)
 
     async def run(
         self,
@@ -179,88 +289,95 @@ class ValidationClient:
         try:
             while self._running:
                 try:
-                    # Check if we need to fetch scores (based on API's current window)
-                    should_fetch = await self._should_fetch_scores()
+                    # Check if we need to fetch scores (based on API's current window) while
+                    # fetching validations if we don't have any pending; the two requests are
+                    # independent, so they share one round trip.
+                    # _should_fetch_scores reuses the status payload it fetched, so /v2/status
+                    # is hit once per check
+                    if not self._current_validations:
+                        status_data, fetched = await asyncio.gather(
+                            self._should_fetch_scores(), self.fetch_validations(), return_exceptions=True
+                        )
+                    else:
+                        status_data, fetched = await self._should_fetch_scores(), None
+                    if isinstance(status_data, BaseException):
+                        if isinstance(status_data, asyncio.CancelledError):
+                            raise status_data
+                        bt.logging.debug(f"[VALIDATION] Failed to check API window: {status_data}")
+                        status_data = None
                     
-                    if should_fetch:
+                    if status_data:
                         try:
-                            # Get current window from status to confirm we should fetch
-                            status_data = await self.fetch_status()
-                            if status_data and status_data.get("status") == "ok":
-                                api_current_window = status_data.get("current_window")
+                            api_current_window = status_data["current_window"]
+                            
+                            # Fetch scores - API now returns scores from the PREVIOUS window
+                            scores_data = await self.fetch_scores()
+                            if scores_data:
+                                # Verify we got scores for the previous window
+                                api_window_start = scores_data.get("block_window_start")
+                                api_window_end = scores_data.get("block_window_end")
+                                api_current_block = scores_data.get("current_block", 0)
                                 
-                                if api_current_window is not None:
-                                    # Fetch scores - API now returns scores from the PREVIOUS window
-                                    scores_data = await self.fetch_scores()
-                                    if scores_data:
-                                        # Verify we got scores for the previous window
-                                        api_window_start = scores_data.get("block_window_start")
-                                        api_window_end = scores_data.get("block_window_end")
-                                        api_current_block = scores_data.get("current_block", 0)
+                                if api_window_start is not None:
+                                    # Use blocks_per_window from API response (source of truth)
+                                    api_blocks_per_window = scores_data.get("blocks_per_window", self.scores_block_interval)
+                                    
+                                    # Calculate window from block_window_start using API's blocks_per_window
+                                    # This should be the previous window (api_current_window - 1)
+                                    calculated_window = api_window_start // api_blocks_per_window
+                                    expected_previous_window = api_current_window - 1
+                                    
+                                    # Verify we got scores for the previous window
+                                    if calculated_window == expected_previous_window or (api_current_window > 0 and calculated_window < api_current_window):
+                                        # Mark that we've fetched scores for this current window
+                                        # (the scores are from the previous window, but we fetched them now)
+                                        self._last_scores_window = api_current_window
+                                        bt.logging.info(
+                                            f"[VALIDATION] Fetched scores for previous block window {calculated_window} "
+                                            f"(blocks {api_window_start}-{api_window_end}, "
+                                            f"current window={api_current_window}, current block={api_current_block})"
+                                        )
                                         
-                                        if api_window_start is not None:
-                                            # Use blocks_per_window from API response (source of truth)
-                                            api_blocks_per_window = scores_data.get("blocks_per_window", self.scores_block_interval)
-                                            
-                                            # Calculate window from block_window_start using API's blocks_per_window
-                                            # This should be the previous window (api_current_window - 1)
-                                            calculated_window = api_window_start // api_blocks_per_window
-                                            expected_previous_window = api_current_window - 1
-                                            
-                                            # Verify we got scores for the previous window
-                                            if calculated_window == expected_previous_window or (api_current_window > 0 and calculated_window < api_current_window):
-                                                # Mark that we've fetched scores for this current window
-                                                # (the scores are from the previous window, but we fetched them now)
-                                                self._last_scores_window = api_current_window
-                                                bt.logging.info(
-                                                    f"[VALIDATION] Fetched scores for previous block window {calculated_window} "
-                                                    f"(blocks {api_window_start}-{api_window_end}, "
-                                                    f"current window={api_current_window}, current block={api_current_block})"
-                                                )
-                                                
-                                                # Call scores callback
-                                                maybe_coro = on_scores(scores_data)
-                                                if asyncio.iscoroutine(maybe_coro):
-                                                    await maybe_coro
-                                            else:
-                                                bt.logging.warning(
-                                                    f"[VALIDATION] Window mismatch: expected previous window {expected_previous_window}, "
-                                                    f"got {calculated_window} (current={api_current_window}), skipping"
-                                                )
-                                        else:
-                                            bt.logging.warning(
-                                                f"[VALIDATION] Invalid scores response: missing block_window_start"
-                                            )
+                                        self._idle_count = 0
+                                        # Call scores callback
+                                        maybe_coro = on_scores(scores_data)
+                                        if asyncio.iscoroutine(maybe_coro):
+                                            await maybe_coro
+                                    else:
+                                        bt.logging.warning(
+                                            f"[VALIDATION] Window mismatch: expected previous window {expected_previous_window}, "
+                                            f"got {calculated_window} (current={api_current_window}), skipping"
+                                        )
                                 else:
-                                    bt.logging.debug(
-                                        f"[VALIDATION] Status response missing current_window, will retry"
+                                    bt.logging.warning(
+                                        f"[VALIDATION] Invalid scores response: missing block_window_start"
                                     )
                         except Exception as e:
                             bt.logging.warning(f"[VALIDATION] Failed to fetch scores: {e}")
 
-                    # Fetch validations if we don't have any pending
-                    if not self._current_validations:
-                        try:
-                            validations = await self.fetch_validations()
-                            if validations:
-                                self._current_validations = validations
-                                bt.logging.info(f"[VALIDATION] Fetched {len(validations)} validation(s)")
-                        except httpx.HTTPStatusError as e:
-                            if e.response.status_code == 404:
-                                # No validations available, continue
-                                pass
-                            else:
-                                bt.logging.warning(f"[VALIDATION] HTTP {e.response.status_code}: {e}")
-                        except Exception as e:
-                            bt.logging.warning(f"[VALIDATION] Failed to fetch validations: {e}")
+                    # Take the validations fetched above
+                    if isinstance(fetched, asyncio.CancelledError):
+                        raise fetched
+                    if isinstance(fetched, httpx.HTTPStatusError):
+                        if fetched.response.status_code == 404:
+                            # No validations available, continue
+                            pass
+                        else:
+                            bt.logging.warning(f"[VALIDATION] HTTP {fetched.response.status_code}: {fetched}")
+                    elif isinstance(fetched, BaseException):
+                        bt.logging.warning(f"[VALIDATION] Failed to fetch validations: {fetched}")
+                    elif fetched:
+                        self._current_validations = fetched
+                        bt.logging.info(f"[VALIDATION] Fetched {len(fetched)} validation(s)")
 
                     # Process all validations at once
                     if self._current_validations:
-                        validations = self._current_validations.copy()
-                        self._current_validations.clear()
+                        # Hand the batch over by swapping lists rather than copy + clear
+                        validations, self._current_validations = self._current_validations, []
                         maybe_coro = on_validations(validations)
                         if asyncio.iscoroutine(maybe_coro):
                             await maybe_coro
+                        self._idle_count = 0
                         # Continue immediately to fetch more validations
                         continue
 
@@ -270,12 +387,14 @@ class ValidationClient:
                     bt.logging.warning(f"[VALIDATION] Error in validation loop: {e}")
 
                 # Sleep only if no validations to process
-                await asyncio.sleep(self.poll_seconds)
+                await asyncio.sleep(self._idle_sleep_seconds())
 
         except asyncio.CancelledError:
             bt.logging.info("[VALIDATION] Validation client cancelled")
             raise
         finally:
             self._running = False
+            if self._owns_client:
+                await self.aclose()
             bt.logging.info("[VALIDATION] Validation client stopped")
 
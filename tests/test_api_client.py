@@ -0,0 +1,77 @@
+from talisman_ai import config
+from talisman_ai.user_miner import api_client
+from talisman_ai.user_miner.api_client import APIClient
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeHotkey:
+    ss58_address = "5Fake"
+
+    def __init__(self):
+        self.signed = []
+
+    def sign(self, message):
+        self.signed.append(message)
+        return message.encode("utf-8")
+
+
+class _FakeWallet:
+    def __init__(self):
+        self.hotkey = _FakeHotkey()
+
+
+def _client(monkeypatch, ttl=10.0):
+    clock = _Clock()
+    monkeypatch.setattr(api_client.time, "time", clock)
+    monkeypatch.setattr(config, "MINER_AUTH_CACHE_SECONDS", ttl)
+    wallet = _FakeWallet()
+    return APIClient(wallet=wallet), wallet, clock
+
+
+def test_auth_headers_reused_within_bucket(monkeypatch):
+    client, wallet, clock = _client(monkeypatch)
+
+    first = client._auth_headers()
+    clock.now += 5
+    second = client._auth_headers()
+    client.close()
+
+    assert second == first
+    assert first["X-Auth-Message"] == "talisman-ai-auth:1000"
+    assert wallet.hotkey.signed == ["talisman-ai-auth:1000"]
+
+
+def test_auth_headers_refreshed_after_bucket_expires(monkeypatch):
+    client, wallet, clock = _client(monkeypatch)
+
+    first = client._auth_headers()
+    clock.now += 10
+    second = client._auth_headers()
+    client.close()
+
+    assert second["X-Auth-Message"] == "talisman-ai-auth:1010"
+    assert second["X-Auth-Signature"] != first["X-Auth-Signature"]
+    assert len(wallet.hotkey.signed) == 2
+
+
+def test_auth_cache_disabled_signs_every_request(monkeypatch):
+    client, wallet, _ = _client(monkeypatch, ttl=0)
+
+    client._auth_headers()
+    client._auth_headers()
+    client.close()
+
+    assert len(wallet.hotkey.signed) == 2
+
+
+def test_no_wallet_sends_no_auth_headers():
+    client = APIClient()
+    assert client._auth_headers() == {}
+    client.close()
@@ -0,0 +1,21 @@
+import pytest
+
+from talisman_ai.analyzer.classifications import ContentType, ImpactPotential, Sentiment
+
+
+def test_from_value_returns_member():
+    assert ContentType.from_value("announcement") is ContentType.ANNOUNCEMENT
+    assert ImpactPotential.from_value("HIGH") is ImpactPotential.HIGH
+
+
+def test_from_value_accepts_members():
+    assert Sentiment.from_value(Sentiment.BULLISH) is Sentiment.BULLISH
+
+
+def test_from_value_rejects_unknown_values():
+    with pytest.raises(ValueError):
+        Sentiment.from_value("sideways")
+    with pytest.raises(ValueError):
+        ImpactPotential.from_value("high")  # values are case-sensitive
+    with pytest.raises(ValueError):
+        ContentType.from_value(["announcement"])  # unhashable
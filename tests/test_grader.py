@@ -0,0 +1,70 @@
+from talisman_ai.validator.grader import CONSENSUS_INVALID, CONSENSUS_VALID, grade_hotkey
+
+
+class _FakeAnalyzer:
+    """Reports every post as 0.5 relevant to "sn1" with neutral sentiment"""
+
+    model = "fake"
+
+    def __init__(self):
+        self.calls = []
+
+    def analyze_post_complete(self, text):
+        self.calls.append(text)
+        return {"subnet_relevance": {"sn1": {"relevance": 0.5}}, "sentiment": 0.0}
+
+
+def _post(post_id, tokens=None, sentiment=0.0):
+    return {
+        "post_id": post_id,
+        "content": f"post {post_id}",
+        "tokens": {"sn1": 0.5} if tokens is None else tokens,
+        "sentiment": sentiment,
+    }
+
+
+def test_matching_posts_are_valid():
+    label, result = grade_hotkey([_post("a"), _post("b")], analyzer=_FakeAnalyzer())
+    assert label == CONSENSUS_VALID
+    assert result["n_posts"] == 2
+
+
+def test_negative_relevance_below_eps_is_valid():
+    # Negative claims are not range errors: a negative value and a missing reference token are
+    # both below eps, so the grader treats them as matching noise
+    label, result = grade_hotkey([_post("a", tokens={"sn1": 0.5, "sn2": -0.2})], analyzer=_FakeAnalyzer())
+    assert label == CONSENSUS_VALID
+    assert result["n_posts"] == 1
+
+
+def test_relevance_above_one_rejected():
+    label, result = grade_hotkey([_post("a", tokens={"sn1": 1.2})], analyzer=_FakeAnalyzer())
+    assert label == CONSENSUS_INVALID
+    assert result["error"]["code"] == "invalid_range"
+
+
+class _FlakyAnalyzer(_FakeAnalyzer):
+    """Batch analysis always fails; single-post analysis fails only for "post bad\""""
+
+    def analyze_posts_each(self, texts):
+        raise RuntimeError("batch failed")
+
+    def analyze_post_complete(self, text):
+        if text == "post bad":
+            raise RuntimeError("bad post")
+        return super().analyze_post_complete(text)
+
+
+def test_batch_failure_falls_back_to_per_post_analysis():
+    analyzer = _FlakyAnalyzer()
+    label, _ = grade_hotkey([_post("a"), _post("b")], analyzer=analyzer)
+    assert label == CONSENSUS_VALID
+    assert analyzer.calls == ["post a", "post b"]
+
+
+def test_analyzer_error_reports_the_failing_post():
+    label, result = grade_hotkey([_post("a"), _post("bad"), _post("c")], analyzer=_FlakyAnalyzer())
+    assert label == CONSENSUS_INVALID
+    assert result["error"]["code"] == "analyzer_error"
+    assert result["error"]["post_id"] == "bad"
+    assert result["error"]["post_index"] == 1
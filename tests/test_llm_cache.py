@@ -0,0 +1,44 @@
+from talisman_ai.analyzer import _llm_cache
+from talisman_ai.analyzer._llm_cache import LLMResponseCache, make_key
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_make_key_is_deterministic_and_prompt_sensitive():
+    messages = [{"role": "user", "content": "hello"}]
+    assert make_key("m", messages, "tool") == make_key("m", list(messages), "tool")
+    assert make_key("m", messages, "tool") != make_key("m2", messages, "tool")
+    assert make_key("m", messages, "tool") != make_key("m", [{"role": "user", "content": "hi"}], "tool")
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(_llm_cache.time, "monotonic", clock)
+    cache = LLMResponseCache(maxsize=10, ttl=60)
+    cache.put("k", "v")
+
+    clock.now += 59
+    assert cache.get("k") == "v"
+    clock.now += 2
+    assert cache.get("k") is None
+    assert cache.stats()["size"] == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LLMResponseCache(maxsize=2, ttl=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["size"] == 2
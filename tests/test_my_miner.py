@@ -0,0 +1,22 @@
+from talisman_ai.user_miner.my_miner import _SeenPostIds
+
+
+def test_seen_post_ids_evicts_oldest():
+    seen = _SeenPostIds(maxsize=3)
+    for pid in ("a", "b", "c", "d"):
+        seen.add(pid)
+
+    assert len(seen) == 3
+    assert "a" not in seen
+    assert all(pid in seen for pid in ("b", "c", "d"))
+
+
+def test_seen_post_ids_readding_does_not_refresh():
+    seen = _SeenPostIds(maxsize=2)
+    seen.add("a")
+    seen.add("b")
+    seen.add("a")  # already seen: insertion order is unchanged
+    seen.add("c")
+
+    assert "a" not in seen
+    assert "b" in seen and "c" in seen
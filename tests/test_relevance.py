@@ -0,0 +1,157 @@
+import re
+from difflib import SequenceMatcher
+
+import pytest
+
+import talisman_ai.analyzer.relevance as relevance
+from talisman_ai.analyzer.classifications import (
+    ContentType,
+    ImpactPotential,
+    MarketAnalysis,
+    Sentiment,
+    TechnicalQuality,
+)
+from talisman_ai.analyzer.relevance import PostClassification, SubnetRelevanceAnalyzer
+from talisman_ai.analyzer.scoring import _build_canonical_from_dict
+
+
+def _classification(**overrides) -> PostClassification:
+    fields = dict(
+        subnet_id=7,
+        subnet_name="sn7",
+        content_type=ContentType.ANNOUNCEMENT,
+        sentiment=Sentiment.BULLISH,
+        technical_quality=TechnicalQuality.MEDIUM,
+        market_analysis=MarketAnalysis.OTHER,
+        impact_potential=ImpactPotential.MEDIUM,
+        relevance_confidence="high",
+        evidence_spans=("SN7", "Mainnet"),
+        anchors_detected=("subnet",),
+    )
+    fields.update(overrides)
+    return PostClassification(**fields)
+
+
+def test_post_classification_is_hashable():
+    a = _classification()
+    b = _classification()
+    assert a == b
+    assert hash(a) == hash(b)
+    assert len({a, b, _classification(subnet_id=8)}) == 2
+
+
+def test_to_dict_round_trips_canonical_string():
+    classification = _classification()
+    as_dict = classification.to_dict()
+    assert as_dict["evidence_spans"] == ["SN7", "Mainnet"]
+    assert as_dict["anchors_detected"] == ["subnet"]
+    assert classification.to_canonical_string() == _build_canonical_from_dict(as_dict)
+    assert classification.to_canonical_string() == (
+        "7|announcement|bullish|medium|other|MEDIUM|high|mainnet|sn7|subnet"
+    )
+
+
+SUBNETS = [
+    {"id": 5, "name": "Kaito", "unique_identifiers": ["openkaito"]},
+    {"id": 23, "name": "Dippy", "unique_identifiers": ["dippy roleplay", "Roleplay"]},
+    {"id": 123, "name": "Sturdy", "unique_identifiers": ["sturdy finance"]},
+]
+
+
+def _reference_classify(subnets, text):
+    """The original per-subnet regex/SequenceMatcher scan that classify_keyword_based must reproduce"""
+    text_lower = text.lower()
+    has_anchor = bool(re.search(r'\bsn\d+\b|\bsubnet\b|\bbittensor\b|\btao\b|\$tao\b|\bopentensor\b', text_lower))
+    ecosystem = re.compile(r'^(bittensor|opentensor|tao|subnets?|sn\d+)$')
+    words = {w for w in re.findall(r'\b\w{4,}\b', text_lower) if not ecosystem.match(w)}
+    matches = []
+    for data in subnets:
+        sid = data["id"]
+        if re.search(rf'\bsn\s*{sid}(?!\d)|\bsubnet\s+{sid}(?!\d)', text_lower):
+            matches.append((sid, data["name"], 1.0, [f"SN{sid}"]))
+            continue
+        best = (0.0, [])
+        for name in [data.get("name", "")] + data.get("unique_identifiers", []):
+            if not name or len(name) < 4 or ecosystem.match(name.lower()):
+                continue
+            name_lower = name.lower()
+            if name_lower in words:
+                best = (0.9, [name])
+                break
+            for word in words:
+                sim = SequenceMatcher(None, word, name_lower).ratio()
+                if sim >= 0.85 and sim > best[0]:
+                    best = (sim * 0.9, [f"{word}\u2248{name}"])
+        if best[0] >= 0.75:
+            matches.append((sid, data["name"], best[0], best[1]))
+    matches.sort(key=lambda x: x[2], reverse=True)
+    if not has_anchor and not matches:
+        return {"is_bittensor": False, "confidence": None, "subnet_scores": {}, "matched_subnets": []}
+    return {
+        "is_bittensor": True,
+        "confidence": "high" if has_anchor else "low",
+        "subnet_scores": {m[0]: m[2] for m in matches},
+        "matched_subnets": matches,
+    }
+
+
+@pytest.fixture(params=["rapidfuzz", "no_rapidfuzz"])
+def analyzer(request, monkeypatch):
+    if request.param == "no_rapidfuzz":
+        monkeypatch.setattr(relevance, "_rf_process", None)
+    elif relevance._rf_process is None:
+        pytest.skip("rapidfuzz not installed")
+    return SubnetRelevanceAnalyzer(model="test", api_key="test", llm_base="http://localhost", subnets=SUBNETS)
+
+
+def test_zero_padded_sn_mention_is_not_a_subnet_hit(analyzer):
+    result = analyzer.classify_keyword_based("Big news from sn023 today")
+    assert result["is_bittensor"] and result["confidence"] == "high"
+    assert result["matched_subnets"] == []
+
+
+def test_sn_mention_glued_to_letters_still_matches(analyzer):
+    result = analyzer.classify_keyword_based("sn23abc")
+    assert result["confidence"] == "low"
+    assert result["matched_subnets"] == [(23, "Dippy", 1.0, ["SN23"])]
+
+
+def test_subnet_number_mention(analyzer):
+    result = analyzer.classify_keyword_based("subnet 5 shipped an update")
+    assert result["confidence"] == "high"
+    assert result["matched_subnets"] == [(5, "Kaito", 1.0, ["SN5"])]
+
+
+def test_sn_mention_does_not_match_longer_id(analyzer):
+    result = analyzer.classify_keyword_based("SN123 is live")
+    assert [m[0] for m in result["matched_subnets"]] == [123]
+
+
+def test_fuzzy_name_hits(analyzer):
+    result = analyzer.classify_keyword_based("dipy and openkaitoo release")
+    assert result["confidence"] == "low"
+    assert [m[0] for m in result["matched_subnets"]] == [5, 23]
+    assert result["matched_subnets"][0][3] == ["openkaitoo\u2248openkaito"]
+    assert result["matched_subnets"][1][3] == ["dipy\u2248Dippy"]
+
+
+def test_results_sorted_by_score(analyzer):
+    result = analyzer.classify_keyword_based("Roleplay launch on SN5, sturdyy next")
+    scores = [m[2] for m in result["matched_subnets"]]
+    assert [m[0] for m in result["matched_subnets"]] == [5, 23, 123]
+    assert scores == sorted(scores, reverse=True)
+
+
+@pytest.mark.parametrize("text", [
+    "Big news from sn023 today",
+    "sn23abc",
+    "subnet 5 shipped an update",
+    "SN123 is live, not sn12",
+    "dipy and openkaitoo release",
+    "Roleplay launch on SN5, sturdyy next",
+    "Kaito kaito KAITO and dippy roleplay",
+    "nothing to see here",
+    "$TAO pumps while subnets sleep",
+])
+def test_matches_reference_implementation(analyzer, text):
+    assert analyzer.classify_keyword_based(text) == _reference_classify(SUBNETS, text)
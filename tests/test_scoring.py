@@ -0,0 +1,121 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from talisman_ai.analyzer.classifications import (
+    ContentType,
+    ImpactPotential,
+    MarketAnalysis,
+    Sentiment,
+    TechnicalQuality,
+)
+from talisman_ai.analyzer.relevance import PostClassification
+from talisman_ai.analyzer.scoring import validate_miner_batch
+
+
+def _classification(subnet_id: int) -> PostClassification:
+    return PostClassification(
+        subnet_id=subnet_id,
+        subnet_name=f"sn{subnet_id}",
+        content_type=ContentType.OTHER,
+        sentiment=Sentiment.NEUTRAL,
+        technical_quality=TechnicalQuality.NONE,
+        market_analysis=MarketAnalysis.OTHER,
+        impact_potential=ImpactPotential.NONE,
+        relevance_confidence="high",
+        evidence_spans=(f"SN{subnet_id}",),
+        anchors_detected=(),
+    )
+
+
+def _post(subnet_id: int, claimed: int = None) -> dict:
+    claim = _classification(subnet_id if claimed is None else claimed).to_dict()
+    return {"post_text": str(subnet_id), "miner_classification": claim}
+
+
+class _FakeAnalyzer:
+    """Classifies a post as the subnet whose id is the post text"""
+
+    def __init__(self):
+        self.calls = []
+
+    def classify_post(self, text):
+        self.calls.append(text)
+        return _classification(int(text))
+
+
+class _PooledAnalyzer(_FakeAnalyzer):
+    def __init__(self):
+        super().__init__()
+        self.pool = ThreadPoolExecutor(max_workers=1)
+
+    def submit_classification(self, text):
+        return self.pool.submit(self.classify_post, text)
+
+
+def test_all_matches_accepted():
+    analyzer = _PooledAnalyzer()
+    batch = [_post(i) for i in range(5)]
+    is_valid, result = validate_miner_batch(batch, analyzer, sample_size=5, seed=1)
+    analyzer.pool.shutdown()
+    assert is_valid
+    assert result["matches"] == 5
+    assert result["total_sampled"] == 5
+    assert result["discrepancies"] == []
+    assert sorted(analyzer.calls) == [str(i) for i in range(5)]
+
+
+def test_invalid_format_fails_fast_without_classifying():
+    analyzer = _FakeAnalyzer()
+    batch = [{"post_text": "1", "miner_classification": {}}] + [_post(i) for i in range(2, 5)]
+    is_valid, result = validate_miner_batch(batch, analyzer, sample_size=4, seed=3)
+    assert not is_valid
+    assert analyzer.calls == []
+    bad_index = result["discrepancies"][0]["post_index"]
+    assert result["discrepancies"][0]["reason"] == "invalid_miner_format"
+    assert result["total_sampled"] == bad_index + 1
+
+
+def test_mismatch_stops_at_first_discrepancy():
+    analyzer = _FakeAnalyzer()
+    batch = [_post(i, claimed=99) for i in range(6)]
+    is_valid, result = validate_miner_batch(batch, analyzer, sample_size=6, seed=0)
+    assert not is_valid
+    assert len(result["discrepancies"]) == 1
+    assert result["discrepancies"][0]["reason"] == "canonical_mismatch"
+    assert result["total_sampled"] == 1
+    # Without a pool, classification is lazy: only the compared post was classified
+    assert len(analyzer.calls) == 1
+
+
+def test_fail_fast_off_collects_every_discrepancy():
+    analyzer = _PooledAnalyzer()
+    batch = [_post(i, claimed=99 if i % 2 else None) for i in range(6)]
+    is_valid, result = validate_miner_batch(batch, analyzer, sample_size=6, seed=0, fail_fast=False)
+    analyzer.pool.shutdown()
+    assert not is_valid
+    assert result["total_sampled"] == 6
+    assert result["matches"] == 3
+    assert len(result["discrepancies"]) == 3
+
+
+def test_seeded_sampling_uses_private_rng():
+    analyzer = _FakeAnalyzer()
+    batch = [_post(i) for i in range(20)]
+    random.seed(1234)
+    expected_global = random.random()
+    random.seed(1234)
+
+    validate_miner_batch(batch, analyzer, sample_size=5, seed=7)
+
+    # Global RNG state is untouched, and the sample is the one Random(seed) picks
+    assert random.random() == expected_global
+    expected = [str(j) for j in random.Random(7).sample(range(20), 5)]
+    assert analyzer.calls == expected
+
+
+def test_sample_size_capped_at_batch_length():
+    analyzer = _FakeAnalyzer()
+    batch = [_post(i) for i in range(3)]
+    is_valid, result = validate_miner_batch(batch, analyzer, sample_size=10, seed=2)
+    assert is_valid
+    assert result["total_sampled"] == 3
@@ -0,0 +1,205 @@
+import asyncio
+
+import httpx
+
+from talisman_ai import config
+from talisman_ai.validator import validation_client
+from talisman_ai.validator.validation_client import ValidationClient
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeHotkey:
+    ss58_address = "5Fake"
+
+    def __init__(self):
+        self.signed = []
+
+    def sign(self, message):
+        self.signed.append(message)
+        return message.encode("utf-8")
+
+
+class _FakeWallet:
+    def __init__(self):
+        self.hotkey = _FakeHotkey()
+
+
+def _client(monkeypatch, ttl=10.0):
+    clock = _Clock()
+    monkeypatch.setattr(validation_client.time, "time", clock)
+    monkeypatch.setattr(config, "VALIDATION_AUTH_CACHE_SECONDS", ttl)
+    wallet = _FakeWallet()
+    return ValidationClient(api_url="http://api.test", wallet=wallet), wallet, clock
+
+
+def test_auth_headers_reused_within_bucket(monkeypatch):
+    client, wallet, clock = _client(monkeypatch)
+
+    first = client._create_auth_headers()
+    clock.now += 9.5
+    second = client._create_auth_headers()
+
+    assert second == first
+    assert first["X-Auth-Message"] == "talisman-ai-auth:1000"
+    assert first["X-Auth-SS58Address"] == "5Fake"
+    assert wallet.hotkey.signed == ["talisman-ai-auth:1000"]
+
+
+def test_auth_headers_refreshed_after_bucket_expires(monkeypatch):
+    client, wallet, clock = _client(monkeypatch)
+
+    client._create_auth_headers()
+    clock.now += 10
+    second = client._create_auth_headers()
+
+    assert second["X-Auth-Message"] == "talisman-ai-auth:1010"
+    assert wallet.hotkey.signed == ["talisman-ai-auth:1000", "talisman-ai-auth:1010"]
+
+
+def test_cached_auth_headers_are_copies(monkeypatch):
+    client, _, _ = _client(monkeypatch)
+
+    headers = client._create_auth_headers()
+    headers["Content-Type"] = "application/json"
+
+    assert "Content-Type" not in client._create_auth_headers()
+
+
+def test_auth_cache_disabled_signs_every_request(monkeypatch):
+    client, wallet, _ = _client(monkeypatch, ttl=0)
+
+    client._create_auth_headers()
+    client._create_auth_headers()
+
+    assert len(wallet.hotkey.signed) == 2
+
+
+def _loop_client(**attrs) -> ValidationClient:
+    client = ValidationClient(api_url="http://api.test", poll_seconds=1)
+    client._idle_sleep_seconds = lambda: 0
+    for name, value in attrs.items():
+        setattr(client, name, value)
+    return client
+
+
+def test_run_checks_status_and_fetches_validations_concurrently():
+    both_started = asyncio.Event()
+    started = []
+
+    async def should_fetch_scores():
+        started.append("status")
+        if len(started) == 2:
+            both_started.set()
+        await both_started.wait()  # would never return if the fetch waited for this call
+        return None
+
+    async def fetch_validations():
+        started.append("validations")
+        if len(started) == 2:
+            both_started.set()
+        await both_started.wait()
+        return [{"validation_id": "v1"}]
+
+    received = []
+
+    def on_validations(validations):
+        received.append(validations)
+        client._running = False
+
+    client = _loop_client(_should_fetch_scores=should_fetch_scores, fetch_validations=fetch_validations)
+    asyncio.run(asyncio.wait_for(client.run(on_validations=on_validations, on_scores=lambda s: None), timeout=5))
+
+    assert sorted(started) == ["status", "validations"]
+    assert received == [[{"validation_id": "v1"}]]
+    assert client._current_validations == []
+
+
+def test_run_status_failure_does_not_drop_fetched_validations():
+    async def should_fetch_scores():
+        raise RuntimeError("status down")
+
+    async def fetch_validations():
+        return [{"validation_id": "v1"}]
+
+    received = []
+
+    async def on_validations(validations):
+        received.append(validations)
+        client._running = False
+
+    client = _loop_client(_should_fetch_scores=should_fetch_scores, fetch_validations=fetch_validations)
+    asyncio.run(asyncio.wait_for(client.run(on_validations=on_validations, on_scores=lambda s: None), timeout=5))
+
+    assert received == [[{"validation_id": "v1"}]]
+
+
+def test_run_fetch_failure_still_delivers_scores():
+    polls = []
+
+    async def should_fetch_scores():
+        polls.append("status")
+        return {"status": "ok", "current_window": 5} if len(polls) == 1 else None
+
+    async def fetch_validations():
+        if len(polls) > 1:
+            client._running = False
+        raise httpx.HTTPStatusError(
+            "not found", request=httpx.Request("GET", "http://api.test"), response=httpx.Response(404)
+        )
+
+    async def fetch_scores():
+        return {"block_window_start": 400, "blocks_per_window": 100}
+
+    scores = []
+    client = _loop_client(
+        _should_fetch_scores=should_fetch_scores, fetch_validations=fetch_validations, fetch_scores=fetch_scores
+    )
+    asyncio.run(asyncio.wait_for(client.run(on_validations=lambda v: None, on_scores=scores.append), timeout=5))
+
+    assert scores == [{"block_window_start": 400, "blocks_per_window": 100}]
+    assert client._last_scores_window == 5
+
+
+def _stop_immediately(client):
+    async def should_fetch_scores():
+        client._running = False
+        return None
+
+    async def fetch_validations():
+        return []
+
+    client._should_fetch_scores = should_fetch_scores
+    client.fetch_validations = fetch_validations
+
+
+def test_run_closes_client_it_created():
+    client = _loop_client()
+    _stop_immediately(client)
+
+    async def run():
+        http = client._get_client()
+        await client.run(on_validations=lambda v: None, on_scores=lambda s: None)
+        return http
+
+    assert asyncio.run(run()).is_closed
+
+
+def test_run_leaves_injected_client_open():
+    async def run():
+        http = validation_client.create_http_client(5.0)
+        client = ValidationClient(api_url="http://api.test", http_client=http)
+        client._idle_sleep_seconds = lambda: 0
+        _stop_immediately(client)
+        await client.run(on_validations=lambda v: None, on_scores=lambda s: None)
+        is_closed = http.is_closed
+        await http.aclose()
+        return is_closed
+
+    assert not asyncio.run(run())
@@ -0,0 +1,224 @@
+import asyncio
+import threading
+from collections import OrderedDict, deque
+
+import neurons.validator as validator_module
+from neurons.validator import Validator
+from talisman_ai.validator.grader import CONSENSUS_INVALID, CONSENSUS_VALID
+
+
+def _make_validator(**attrs) -> Validator:
+    """A Validator with only the attributes the tested methods touch (no chain, wallet or API)"""
+    v = Validator.__new__(Validator)
+    v._analyzer = None
+    v._grade_cache = OrderedDict()
+    v._grade_cache_max = 4096
+    v._grade_cache_lock = threading.Lock()
+    v._max_pending = 10
+    v._pending_results = deque(maxlen=v._max_pending)
+    v._pending_synapses = {}
+    v._submit_lock = asyncio.Lock()
+    v._submit_retries = 2
+    v._submit_backoff_base = 0.0
+    v._submit_backoff_cap = 0.0
+    v._submit_fail_count = 0
+    v._submit_fail_traceback_limit = 3
+    for name, value in attrs.items():
+        setattr(v, name, value)
+    return v
+
+
+def _fake_grader(label):
+    calls = []
+
+    def grade(posts, analyzer=None):
+        calls.append(posts[0]["post_id"])
+        return label, {"n_posts": 1}
+
+    return grade, calls
+
+
+def test_grade_post_caches_passes(monkeypatch):
+    grade, calls = _fake_grader(CONSENSUS_VALID)
+    monkeypatch.setattr(validator_module, "grade_hotkey", grade)
+    v = _make_validator()
+    post = {"post_id": "p1", "content": "hello", "tokens": {"sn1": 0.5}}
+
+    first = v._grade_post(post)
+    second = v._grade_post(dict(post))
+
+    assert first == second
+    assert calls == ["p1"]
+
+
+def test_grade_post_regrades_failures(monkeypatch):
+    grade, calls = _fake_grader(CONSENSUS_INVALID)
+    monkeypatch.setattr(validator_module, "grade_hotkey", grade)
+    v = _make_validator()
+    post = {"post_id": "p1", "content": "hello"}
+
+    v._grade_post(post)
+    v._grade_post(post)
+
+    assert calls == ["p1", "p1"]
+    assert len(v._grade_cache) == 0
+
+
+def test_grade_post_cache_key_covers_full_payload(monkeypatch):
+    grade, calls = _fake_grader(CONSENSUS_VALID)
+    monkeypatch.setattr(validator_module, "grade_hotkey", grade)
+    v = _make_validator()
+
+    v._grade_post({"post_id": "p1", "content": "hello", "sentiment": 0.0})
+    v._grade_post({"post_id": "p1", "content": "hello", "sentiment": 0.5})
+
+    assert calls == ["p1", "p1"]
+
+
+def test_grade_post_cache_evicts_oldest(monkeypatch):
+    grade, calls = _fake_grader(CONSENSUS_VALID)
+    monkeypatch.setattr(validator_module, "grade_hotkey", grade)
+    v = _make_validator(_grade_cache_max=2)
+
+    for pid in ("a", "b", "c", "a"):
+        v._grade_post({"post_id": pid})
+
+    assert calls == ["a", "b", "c", "a"]
+    assert len(v._grade_cache) == 2
+
+
+class _FakeValidationClient:
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.submitted = []
+
+    async def submit_results(self, results):
+        if self.failures > 0:
+            self.failures -= 1
+            raise RuntimeError("API unavailable")
+        self.submitted.append(results)
+        return {"accepted": len(results)}
+
+
+def test_submit_pending_results_success_after_retry():
+    client = _FakeValidationClient(failures=1)
+    v = _make_validator(_validation_client=client)
+    v._pending_results.extend([1, 2, 3])
+
+    asyncio.run(v._submit_pending_results())
+
+    assert client.submitted == [[1, 2, 3]]
+    assert list(v._pending_results) == []
+    assert v._submit_fail_count == 0
+
+
+def test_submit_pending_results_requeues_on_failure():
+    client = _FakeValidationClient(failures=2)
+    v = _make_validator(_validation_client=client)
+    v._pending_results.extend([1, 2, 3])
+
+    asyncio.run(v._submit_pending_results())
+
+    assert client.submitted == []
+    assert list(v._pending_results) == [1, 2, 3]
+    assert v._submit_fail_count == 1
+
+
+def test_submit_pending_results_requeue_drops_oldest_when_full():
+    client = _FakeValidationClient(failures=2)
+    v = _make_validator(_validation_client=client, _max_pending=4)
+    v._pending_results = deque([1, 2, 3], maxlen=4)
+
+    async def submit_while_new_results_arrive():
+        task = asyncio.create_task(v._submit_pending_results())
+        await asyncio.sleep(0)  # let the flush swap the buffer out
+        v._pending_results.extend([4, 5])
+        await task
+
+    asyncio.run(submit_while_new_results_arrive())
+
+    # Failed results go back ahead of the new ones; the oldest is dropped
+    assert list(v._pending_results) == [2, 3, 4, 5]
+
+
+def test_results_arriving_mid_flush_wait_for_next_flush():
+    client = _FakeValidationClient(failures=1)
+    v = _make_validator(_validation_client=client)
+    v._pending_results.extend([1, 2])
+
+    async def submit_while_new_results_arrive():
+        task = asyncio.create_task(v._submit_pending_results())
+        await asyncio.sleep(0)  # let the flush swap the buffer out
+        v._pending_results.append(3)
+        await task
+
+    asyncio.run(submit_while_new_results_arrive())
+
+    assert client.submitted == [[1, 2]]
+    assert list(v._pending_results) == [3]
+
+
+def test_submit_fail_count_resets_after_success():
+    client = _FakeValidationClient(failures=4)
+    v = _make_validator(_validation_client=client)
+    v._pending_results.append(1)
+
+    asyncio.run(v._submit_pending_results())
+    asyncio.run(v._submit_pending_results())
+    assert v._submit_fail_count == 2
+
+    asyncio.run(v._submit_pending_results())
+    assert client.submitted == [[1]]
+    assert v._submit_fail_count == 0
+
+
+def test_synapses_sent_after_submission():
+    events = []
+    client = _FakeValidationClient(failures=0)
+    original_submit = client.submit_results
+
+    async def submit_results(results):
+        events.append("submit")
+        return await original_submit(results)
+
+    async def send(by_hotkey):
+        events.append(("send", by_hotkey))
+
+    client.submit_results = submit_results
+    v = _make_validator(_validation_client=client, _send_batched_validation_results=send)
+    v._pending_results.extend([1, 2])
+    v._pending_synapses = {"hk": [{"validation_id": "v1"}, {"validation_id": "v2"}]}
+
+    asyncio.run(v._submit_pending_results())
+
+    assert events == ["submit", ("send", {"hk": [{"validation_id": "v1"}, {"validation_id": "v2"}]})]
+    assert v._pending_synapses == {}
+
+
+def test_synapses_wait_for_flush_below_batch_size():
+    sent = []
+
+    async def process(validation, by_hotkey):
+        by_hotkey.setdefault(validation["miner_hotkey"], []).append(validation["validation_id"])
+        return validation["validation_id"]
+
+    async def send(by_hotkey):
+        sent.append(by_hotkey)
+
+    client = _FakeValidationClient(failures=0)
+    v = _make_validator(
+        _validation_client=client,
+        _batch_size=3,
+        _process_single_validation=process,
+        _send_batched_validation_results=send,
+    )
+
+    asyncio.run(v._on_validations([{"validation_id": "v1", "miner_hotkey": "hk"}]))
+    assert client.submitted == [] and sent == []
+
+    asyncio.run(v._on_validations([
+        {"validation_id": "v2", "miner_hotkey": "hk"},
+        {"validation_id": "v3", "miner_hotkey": "hk2"},
+    ]))
+    assert client.submitted == [["v1", "v2", "v3"]]
+    assert sent == [{"hk": ["v1", "v2"], "hk2": ["v3"]}]